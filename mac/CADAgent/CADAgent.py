@@ -14,14 +14,13 @@ Key features:
 
 from __future__ import annotations
 
-import base64
 import json
 import logging
 import os
 import queue
 import threading
 import uuid
-import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -61,57 +60,18 @@ DEFAULT_SUPABASE_PUBLISHABLE_KEY = "sb_publishable_9pBlFZWV0LzXWNqYHgULpg_Gy86vf
 def _fusion_probe(message: str) -> None:
     """Best-effort bridge to Fusion's Text Commands log for field diagnostics."""
     try:
-        import adsk.core  # type: ignore
-
-        app = adsk.core.Application.get()
+        app = general_utils.get_app()
         if app:
             app.log(message)
     except Exception:
         # Don't let probe logging crash the add-in
         pass
 
-# Minimal .env loader (avoids dependency on python-dotenv in Fusion sandbox)
-def _strip_inline_env_comment(value: str) -> str:
-    """Strip inline comments from unquoted env values."""
-    in_single = False
-    in_double = False
-    for i, ch in enumerate(value):
-        if ch == '\"' and not in_single:
-            in_double = not in_double
-        elif ch == "'" and not in_double:
-            in_single = not in_single
-        elif ch == '#' and not in_single and not in_double:
-            # Treat as comment only when preceded by whitespace (KEY=VALUE # comment)
-            if i > 0 and value[i - 1].isspace():
-                return value[:i].rstrip()
-    return value
-
-
-def _load_env_file(path: Path) -> None:
-    if not path.exists():
-        logger.warning(f"Env file not found: {path}")
-        return
-    try:
-        for line in path.read_text().splitlines():
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            if '=' not in line:
-                continue
-            key, value = line.split('=', 1)
-            key = key.strip()
-            value = value.strip()
-            value = _strip_inline_env_comment(value)
-            value = value.strip('"').strip("'")
-            if key and key not in os.environ:
-                os.environ[key] = value
-        logger.info(f"Loaded environment from {path}")
-    except Exception as exc:
-        logger.warning(f"Failed to load env file {path}: {exc}")
 
-# Load only the CADAgent-specific env file to avoid pulling unrelated secrets.
-cadagent_env_path = Path(__file__).resolve().parent / ".env.cadagent"
-_load_env_file(cadagent_env_path)
+# The CADAgent-specific env file (.env.cadagent) is loaded once by ``config``
+# on import; re-parsing it here would only repeat work at every add-in start.
+if not config.ENV_FILE_LOADED:
+    logger.warning(f"Env file not found: {config.ENV_FILE_PATH}")
 
 # Global references maintained by Fusion 360
 _app: Optional[adsk.core.Application] = None
@@ -196,6 +156,11 @@ class AgentController:
         self._running = False
         self._plan_chunks: Dict[str, List[str]] = {}
         self._pending_plan_full: Dict[str, str] = {}
+        # Reused worker for snapshot PNG encoding (one request captures at a time)
+        self._snapshot_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="CADAgentSnapshotEncode")
+        # PNG path under the add-in's data dir reused by every snapshot (requests capture one
+        # at a time); the capture is deleted once encoded, and again in stop() if one is left
+        self._snapshot_path: Optional[Path] = None
 
         self._auth_bypass = (
             os.environ.get("CADAGENT_AUTH_BYPASS", os.environ.get("AUTH_BYPASS", "false")).lower()
@@ -225,7 +190,7 @@ class AgentController:
                                 # Push profile to palette immediately; queued until handshake/UI ready
                                 self._palette_manager.send_message('user_profile', profile=profile)
                             except Exception as push_err:
-                                logger.debug(f"Deferred profile push failed (will retry on UI request): {push_err}")
+                                logger.debug("Deferred profile push failed (will retry on UI request): %s", push_err)
                         else:
                             logger.warning("Session restored but validation failed - session cleared")
                     except Exception as validation_error:
@@ -282,7 +247,7 @@ class AgentController:
                     evt.add(h)
                     self._event_handlers.append(h)
             except Exception as e:
-                logger.debug(f"Event subscription failed for {evt_name}: {e}")
+                logger.debug("Event subscription failed for %s: %s", evt_name, e)
 
     # ------------------------------------------------------------------ Lifecycle
     def start(self) -> None:
@@ -294,6 +259,11 @@ class AgentController:
         # Set running flag before starting timer
         self._running = True
 
+        # A restored session already reached Supabase while validating its profile;
+        # otherwise connect now so the user's first sign-in skips the TLS handshake
+        if self._auth_client and not self._auth_client.get_session():
+            self._palette_manager.run_auth_job(self._auth_client.warm_up, "CADAgentAuthWarmUp")
+
         # Initialize per-document session for current active document (if any)
         # Note: During startup, the document may not be fully initialized yet, which can
         # cause InternalValidationError. This is not fatal - the documentActivated event
@@ -323,7 +293,7 @@ class AgentController:
         try:
             self._push_api_keys_all_sessions(reason="startup")
         except Exception as e:
-            logger.debug(f"[api_keys] startup push failed: {e}")
+            logger.debug("[api_keys] startup push failed: %s", e)
 
         # If already authenticated, proactively sync key status to UI
         try:
@@ -331,7 +301,7 @@ class AgentController:
                 status = self.get_api_keys_status()
                 self._palette_manager.send_message('api_keys_status', status=status)
         except Exception as e:
-            logger.debug(f"[api_keys] startup status push failed: {e}")
+            logger.debug("[api_keys] startup status push failed: %s", e)
 
         logger.info("=" * 70)
         logger.info("CADAGENT CONTROLLER READY")
@@ -355,14 +325,7 @@ class AgentController:
         self._running = False
 
         # Stop all WebSocket connections
-        try:
-            for doc_id, info in list(self._sessions.items()):
-                client = info.get('ws_client')
-                if client:
-                    client.stop()
-                    logger.info(f"WebSocket client stopped for doc {doc_id}")
-        except Exception as e:
-            logger.error(f"Failed to stop WebSocket clients: {e}")
+        self._stop_ws_clients(list(self._sessions.items()))
 
         # Stop palette UI
         try:
@@ -371,6 +334,15 @@ class AgentController:
         except Exception as e:
             logger.error(f"Failed to stop palette: {e}")
 
+        # Release pooled auth HTTP connections
+        if self._auth_client:
+            self._auth_client.close()
+
+        # Don't block Fusion's UI thread on an in-flight snapshot encode
+        self._snapshot_executor.shutdown(wait=False)
+        self._discard_snapshot_file(self._snapshot_path)
+        self._snapshot_path = None
+
         # Unregister custom event
         try:
             if self._plan_approval_event:
@@ -383,6 +355,31 @@ class AgentController:
         self._event_handlers.clear()
         logger.info("CADAgent controller stopped")
 
+    @staticmethod
+    def _stop_ws_clients(sessions: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """Stop the WebSocket clients of the given sessions, closing them concurrently.
+
+        Each client runs its own event loop thread and stop() waits for the close
+        handshake, so closing one at a time would add those waits up on the UI thread.
+        """
+        clients = [(doc_id, info['ws_client']) for doc_id, info in sessions if info.get('ws_client')]
+        if not clients:
+            return
+
+        def _stop(doc_id: str, client: FusionWebSocketClient) -> None:
+            try:
+                client.stop()
+                logger.info("WebSocket client stopped for doc %s", doc_id)
+            except Exception as e:
+                logger.error(f"Failed to stop WebSocket client for doc {doc_id}: {e}")
+
+        if len(clients) == 1:
+            _stop(*clients[0])
+            return
+        with ThreadPoolExecutor(max_workers=min(8, len(clients)), thread_name_prefix="CADAgentWsStop") as pool:
+            for doc_id, client in clients:
+                pool.submit(_stop, doc_id, client)
+
     # ------------------------------------------------------------------ Public API
     def submit_user_request(
         self,
@@ -442,18 +439,12 @@ class AgentController:
         doc_id = self._active_doc_id
 
         visual_context_payload: Optional[Dict[str, Any]] = None
+        visual_context_future: Optional["Future[Optional[Dict[str, Any]]]"] = None
         selection_context: Optional[Dict[str, Any]] = None
 
         if include_visual_context and not planning_mode:
-            visual_context_payload = self._capture_visual_context_snapshot()
-            if visual_context_payload:
-                logger.info(
-                    "Attaching visual context snapshot (%dx%d)",
-                    visual_context_payload.get("width", 0),
-                    visual_context_payload.get("height", 0)
-                )
-            else:
-                self._palette_manager.send_log('warning', 'Unable to capture visual context snapshot.', doc_id=doc_id)
+            # Renders on the main thread now; the PNG encode overlaps the context extraction below.
+            visual_context_future = self._capture_visual_context_snapshot()
 
         try:
             selection_context = extract_selection_context(self._app)
@@ -471,6 +462,18 @@ class AgentController:
         # Extract entity context (bodies, faces, edges) - always include for LLM awareness
         entity_context = self._extract_entity_context()
 
+        if include_visual_context and not planning_mode:
+            if visual_context_future is not None:
+                visual_context_payload = visual_context_future.result()
+            if visual_context_payload:
+                logger.info(
+                    "Attaching visual context snapshot (%dx%d)",
+                    visual_context_payload.get("width", 0),
+                    visual_context_payload.get("height", 0)
+                )
+            else:
+                self._palette_manager.send_log('warning', 'Unable to capture visual context snapshot.', doc_id=doc_id)
+
         payload: Dict[str, Any] = {
             "type": "planning_request" if planning_mode else "execute_request",
             "user_request": request_text,
@@ -511,37 +514,38 @@ class AgentController:
             payload["attachments"] = attachments
             logger.info("Including %d attachment(s) in request", len(attachments))
         logger.info(f"Submitting {'planning' if planning_mode else 'execution'} request with model {model_name}")
-        debug_payload = dict(payload)
-        if debug_payload.get("image_data"):
-            debug_payload["image_data"] = "<base64 omitted>"
-        if "attachments" in debug_payload:
-            redacted_attachments = []
-            for attachment in debug_payload.get("attachments") or []:
-                if isinstance(attachment, dict):
-                    redacted = dict(attachment)
-                    if "data" in redacted:
-                        redacted["data"] = "<base64 omitted>"
-                    redacted_attachments.append(redacted)
-                else:
-                    redacted_attachments.append("<non-object attachment>")
-            debug_payload["attachments"] = redacted_attachments
-        if visual_context_payload:
-            redacted = {key: ("<base64 omitted>" if key == "data" else value)
-                        for key, value in visual_context_payload.items()}
-            debug_payload["visual_context"] = redacted
-        if selection_context:
-            entities = selection_context.get("entities") or []
-            debug_payload["selection_context"] = {
-                "count": selection_context.get("count"),
-                "entities": [
-                    {
-                        "type": entity.get("type"),
-                        "geometry_type": entity.get("geometry_type"),
-                    }
-                    for entity in entities
-                ]
-            }
-        logger.debug(f"Request payload: {debug_payload}")
+        # The redacted copy is only for the debug log; skip building and formatting it
+        # (it walks every selected entity) unless DEBUG logging is actually enabled.
+        if logger.isEnabledFor(logging.DEBUG):
+            debug_payload = dict(payload)
+            if debug_payload.get("image_data"):
+                debug_payload["image_data"] = "<base64 omitted>"
+            if "attachments" in debug_payload:
+                redacted_attachments = []
+                for attachment in debug_payload.get("attachments") or []:
+                    if isinstance(attachment, dict):
+                        # Only attachments carrying inline data need a redacted copy
+                        if "data" in attachment:
+                            attachment = {**attachment, "data": "<base64 omitted>"}
+                        redacted_attachments.append(attachment)
+                    else:
+                        redacted_attachments.append("<non-object attachment>")
+                debug_payload["attachments"] = redacted_attachments
+            if visual_context_payload and "data" in visual_context_payload:
+                debug_payload["visual_context"] = {**visual_context_payload, "data": "<base64 omitted>"}
+            if selection_context:
+                entities = selection_context.get("entities") or []
+                debug_payload["selection_context"] = {
+                    "count": selection_context.get("count"),
+                    "entities": [
+                        {
+                            "type": entity.get("type"),
+                            "geometry_type": entity.get("geometry_type"),
+                        }
+                        for entity in entities
+                    ]
+                }
+            logger.debug("Request payload: %s", debug_payload)
 
         try:
             client.send_json(payload)
@@ -640,10 +644,13 @@ class AgentController:
         msg_type = message.get("type", "<no type>")
         if msg_type not in _QUIET_MESSAGE_TYPES:
             logger.debug("[CADAGENT_ENQUEUE] Message enqueued: doc_id=%s, type=%s", doc_id, msg_type)
-            _fusion_probe(f"[CADAGENT_ENQUEUE] doc_id={doc_id}, type={msg_type}")
+            if config.DEBUG:
+                _fusion_probe(f"[CADAGENT_ENQUEUE] doc_id={doc_id}, type={msg_type}")
 
         self._incoming_messages.put((doc_id, message))
-        logger.debug(f"Message enqueued for doc {doc_id}, queue size: {self._incoming_messages.qsize()}")
+        # qsize() takes the queue lock, so only pay for it when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Message enqueued for doc %s, queue size: %d", doc_id, self._incoming_messages.qsize())
         if self._running and self._app:
             try:
                 self._app.fireCustomEvent(self._inbound_event_id, "")
@@ -658,10 +665,16 @@ class AgentController:
             current_thread.ident,
             current_thread.name,
         )
-        while not self._incoming_messages.empty():
-            doc_id, message = self._incoming_messages.get()
+        # Bound once for the drain loop; streamed responses can queue many messages per event
+        incoming = self._incoming_messages
+        handle_message = self._handle_message
+        while True:
+            try:
+                doc_id, message = incoming.get_nowait()
+            except queue.Empty:
+                break
             try:
-                self._handle_message(doc_id, message)
+                handle_message(doc_id, message)
             except Exception as e:
                 logger.exception(f"Failed to handle message: {message}")
                 general_utils.log_error("Message handling error", e)
@@ -672,8 +685,8 @@ class AgentController:
         # INSTRUMENTATION: Track message handling in CADAgent
         if message_type not in _QUIET_MESSAGE_TYPES:
             logger.debug("[CADAGENT_HANDLE] Handling message: doc_id=%s, type=%s", doc_id, message_type)
-            _fusion_probe(f"[CADAGENT_HANDLE] doc_id={doc_id}, type={message_type}")
-        logger.debug(f"Handling message type: {message_type}")
+            if config.DEBUG:
+                _fusion_probe(f"[CADAGENT_HANDLE] doc_id={doc_id}, type={message_type}")
 
         if message_type == "execute_code":
             self._handle_execute_code(doc_id, message)
@@ -857,7 +870,7 @@ class AgentController:
                     status = self.get_api_keys_status()
                     self._palette_manager.send_message('api_keys_status', status=status)
                 except Exception as status_err:
-                    logger.debug(f"[api_keys] Failed to send status after auth_ack: {status_err}")
+                    logger.debug("[api_keys] Failed to send status after auth_ack: %s", status_err)
             except Exception as e:
                 logger.warning(f"[api_keys] Auto-push on auth_ack failed: {e}")
         elif message_type == "api_keys_updated":
@@ -888,8 +901,8 @@ class AgentController:
             logger.error("Received execute_code message without code")
             return
 
-        logger.info(f"Executing operation: {operation}")
-        logger.debug(f"Code to execute:\n{code}")
+        logger.info("Executing operation: %s", operation)
+        logger.debug("Code to execute:\n%s", code)
 
         session_info = self._get_session_info_by_doc(doc_id)
         if not session_info:
@@ -951,7 +964,7 @@ class AgentController:
             if key not in payload:
                 payload[key] = value
 
-        logger.info(f"Operation {operation} {'succeeded' if result.get('success') else 'failed'}")
+        logger.info("Operation %s %s", operation, "succeeded" if result.get("success") else "failed")
 
         if result.get("success"):
             self._palette_manager.send_log('success', f"✓ {operation} completed", doc_id=doc_id)
@@ -991,6 +1004,29 @@ class AgentController:
         except Exception:  # pragma: no cover - defensive
             logger.debug("Failed to send selection feedback to palette", exc_info=True)
 
+    def _report_selection_operation_error(
+        self,
+        doc_id: str,
+        geometry: str,
+        operation: Optional[str],
+        payload: Dict[str, Any],
+        message_text: str,
+    ) -> None:
+        """Mark a body/edge/face operation result as failed and surface the error in the palette."""
+        payload.update({
+            "success": False,
+            "error": message_text,
+        })
+        self._palette_manager.send_log('error', message_text, doc_id=doc_id)
+        if operation:
+            self._send_selection_feedback(
+                doc_id,
+                geometry,
+                operation,
+                success=False,
+                message=message_text,
+            )
+
     @staticmethod
     def _build_edge_preview(edges: List[Dict[str, Any]], limit: int = SELECTION_PREVIEW_LIMIT) -> List[Dict[str, Any]]:
         """Return a trimmed list of edge metadata suitable for UI display."""
@@ -1176,35 +1212,11 @@ class AgentController:
 
         except body_tools.BodyOperationError as exc:
             message_text = str(exc)
-            payload.update({
-                "success": False,
-                "error": message_text,
-            })
-            self._palette_manager.send_log('error', message_text, doc_id=doc_id)
-            if operation:
-                self._send_selection_feedback(
-                    doc_id,
-                    "body",
-                    operation,
-                    success=False,
-                    message=message_text,
-                )
+            self._report_selection_operation_error(doc_id, "body", operation, payload, message_text)
         except Exception as exc:  # pragma: no cover - defensive
             message_text = f"Unexpected error: {exc}"
             logger.exception("Unexpected error while handling body operation.")
-            payload.update({
-                "success": False,
-                "error": message_text,
-            })
-            self._palette_manager.send_log('error', message_text, doc_id=doc_id)
-            if operation:
-                self._send_selection_feedback(
-                    doc_id,
-                    "body",
-                    operation,
-                    success=False,
-                    message=message_text,
-                )
+            self._report_selection_operation_error(doc_id, "body", operation, payload, message_text)
         finally:
             payload.setdefault("success", success)
             payload.setdefault("message", message_text)
@@ -1349,35 +1361,11 @@ class AgentController:
 
         except edge_tools.EdgeOperationError as exc:
             message_text = str(exc)
-            payload.update({
-                "success": False,
-                "error": message_text,
-            })
-            self._palette_manager.send_log('error', message_text, doc_id=doc_id)
-            if operation:
-                self._send_selection_feedback(
-                    doc_id,
-                    "edge",
-                    operation,
-                    success=False,
-                    message=message_text,
-                )
+            self._report_selection_operation_error(doc_id, "edge", operation, payload, message_text)
         except Exception as exc:  # pragma: no cover - defensive
             message_text = f"Unexpected error: {exc}"
             logger.exception("Unexpected error while handling edge operation.")
-            payload.update({
-                "success": False,
-                "error": message_text,
-            })
-            self._palette_manager.send_log('error', message_text, doc_id=doc_id)
-            if operation:
-                self._send_selection_feedback(
-                    doc_id,
-                    "edge",
-                    operation,
-                    success=False,
-                    message=message_text,
-                )
+            self._report_selection_operation_error(doc_id, "edge", operation, payload, message_text)
         finally:
             # Ensure payload has success flag and message
             payload.setdefault("success", success)
@@ -1524,35 +1512,11 @@ class AgentController:
 
         except face_tools.FaceOperationError as exc:
             message_text = str(exc)
-            payload.update({
-                "success": False,
-                "error": message_text,
-            })
-            self._palette_manager.send_log('error', message_text, doc_id=doc_id)
-            if operation:
-                self._send_selection_feedback(
-                    doc_id,
-                    "face",
-                    operation,
-                    success=False,
-                    message=message_text,
-                )
+            self._report_selection_operation_error(doc_id, "face", operation, payload, message_text)
         except Exception as exc:  # pragma: no cover - defensive
             message_text = f"Unexpected error: {exc}"
             logger.exception("Unexpected error while handling face operation.")
-            payload.update({
-                "success": False,
-                "error": message_text,
-            })
-            self._palette_manager.send_log('error', message_text, doc_id=doc_id)
-            if operation:
-                self._send_selection_feedback(
-                    doc_id,
-                    "face",
-                    operation,
-                    success=False,
-                    message=message_text,
-                )
+            self._report_selection_operation_error(doc_id, "face", operation, payload, message_text)
         finally:
             payload.setdefault("success", success)
             payload.setdefault("message", message_text)
@@ -2355,8 +2319,17 @@ class AgentController:
 
 
     # ------------------------------------------------------------------ Helpers
-    def _capture_visual_context_snapshot(self) -> Optional[Dict[str, Any]]:
-        """Capture the active viewport and return it as a base64-encoded PNG bundle."""
+    def _capture_visual_context_snapshot(self) -> Optional["Future[Optional[Dict[str, Any]]]"]:
+        """
+        Capture the active viewport as a PNG and base64-encode it off the main thread.
+
+        saveAsImageFile must run on the Fusion main thread, but reading and encoding
+        the image never touches adsk.* APIs, so that part runs on a worker thread.
+
+        Returns:
+            Future resolving to the base64-encoded PNG bundle (or None if encoding
+            failed), or None if the viewport could not be captured.
+        """
         viewport = self._app.activeViewport if self._app else None
         if not viewport:
             logger.warning("Visual context capture skipped: no active viewport is available.")
@@ -2383,29 +2356,48 @@ class AgentController:
             fallback_height = viewport_height if viewport_height > 0 else 720
             target_height = max(1, min(720, fallback_height))
 
-        tmp_file_path: Optional[Path] = None
-        encoded_image: Optional[str] = None
-
         try:
-            temp_file = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
-            tmp_file_path = Path(temp_file.name)
-            temp_file.close()
-
+            tmp_file_path = self._get_snapshot_path()
             success = viewport.saveAsImageFile(str(tmp_file_path), target_width, target_height)
             if not success:
                 raise RuntimeError("saveAsImageFile returned False")
-
-            image_bytes = tmp_file_path.read_bytes()
-            encoded_image = base64.b64encode(image_bytes).decode("ascii")
         except Exception as exc:
             logger.exception("Failed to capture visual context snapshot: %s", exc)
+            self._discard_snapshot_file(self._snapshot_path)
+            return None
+
+        try:
+            return self._snapshot_executor.submit(
+                self._encode_snapshot_file, tmp_file_path, target_width, target_height
+            )
+        except RuntimeError as exc:
+            # Executor already shut down (add-in stopping); a missing snapshot is non-fatal
+            logger.warning("Visual context encode skipped: %s", exc)
+            self._discard_snapshot_file(tmp_file_path)
+            return None
+
+    def _get_snapshot_path(self) -> Path:
+        """Return the reusable snapshot path in ~/.cadagent, creating the directory on first use.
+
+        Fusion's saveAsImageFile writes the file itself on each capture.
+        """
+        if self._snapshot_path is None:
+            snapshot_dir = Path.home() / ".cadagent"
+            snapshot_dir.mkdir(parents=True, exist_ok=True)
+            self._snapshot_path = snapshot_dir / "viewport_snapshot.png"
+        return self._snapshot_path
+
+    @staticmethod
+    def _encode_snapshot_file(tmp_file_path: Path, width: int, height: int) -> Optional[Dict[str, Any]]:
+        """Read a captured PNG, base64-encode it and delete it (thread-safe, no adsk.* calls)."""
+        try:
+            encoded_image = camera_tools.encode_image_file(tmp_file_path)
+        except Exception as exc:
+            logger.exception("Failed to encode visual context snapshot: %s", exc)
             return None
         finally:
-            if tmp_file_path and tmp_file_path.exists():
-                try:
-                    tmp_file_path.unlink()
-                except Exception as cleanup_error:
-                    logger.debug("Unable to delete temporary snapshot file %s: %s", tmp_file_path, cleanup_error)
+            # Don't leave the last viewport capture on disk between requests
+            AgentController._discard_snapshot_file(tmp_file_path)
 
         if not encoded_image:
             return None
@@ -2414,10 +2406,18 @@ class AgentController:
             "media_type": "image/png",
             "data": encoded_image,
             "label": "Visual state of the 3D model inside Fusion 360",
-            "width": target_width,
-            "height": target_height,
+            "width": width,
+            "height": height,
         }
 
+    @staticmethod
+    def _discard_snapshot_file(tmp_file_path: Optional[Path]) -> None:
+        if tmp_file_path and tmp_file_path.exists():
+            try:
+                tmp_file_path.unlink()
+            except Exception as cleanup_error:
+                logger.debug("Unable to delete temporary snapshot file %s: %s", tmp_file_path, cleanup_error)
+
     def _extract_entity_context(
         self,
         design: Optional[adsk.fusion.Design] = None,
@@ -2478,6 +2478,14 @@ class AgentController:
             faces_list = context.get("faces", [])
             edges_list = context.get("edges", [])
 
+            # Group faces/edges by owning body in one pass (order within each body is kept)
+            faces_by_body: Dict[Any, List[Dict[str, Any]]] = {}
+            for f in faces_list:
+                faces_by_body.setdefault(f.get("body_index"), []).append(f)
+            edges_by_body: Dict[Any, List[Dict[str, Any]]] = {}
+            for e in edges_list:
+                edges_by_body.setdefault(e.get("body_index"), []).append(e)
+
             spatial_bodies = []
             all_vertices = []  # Flat list for backward compatibility
 
@@ -2491,9 +2499,9 @@ class AgentController:
                     v_copy["body_index"] = body_idx
                     all_vertices.append(v_copy)
 
-                # Filter faces and edges belonging to this body
-                body_faces = [f for f in faces_list if f.get("body_index") == body_idx]
-                body_edges = [e for e in edges_list if e.get("body_index") == body_idx]
+                # Faces and edges belonging to this body
+                body_faces = faces_by_body.get(body_idx, [])
+                body_edges = edges_by_body.get(body_idx, [])
 
                 spatial_bodies.append({
                     "id": body.get("id"),
@@ -2538,9 +2546,10 @@ class AgentController:
             return {"items": [], "marker_position": 0, "count": 0}
 
         timeline = design.timeline
+        count = timeline.count
         items: List[Dict[str, Any]] = []
 
-        for index in range(timeline.count):
+        for index in range(count):
             item = timeline.item(index)
             entity = item.entity
             entity_name = ""
@@ -2555,9 +2564,8 @@ class AgentController:
             })
 
         marker_position = timeline.markerPosition
-        count = timeline.count
 
-        logger.debug(f"Collected timeline state with {count} items, marker at position {marker_position}")
+        logger.debug("Collected timeline state with %d items, marker at position %d", count, marker_position)
         return {
             "items": items,
             "marker_position": marker_position,
@@ -2650,8 +2658,6 @@ class AgentController:
             try:
                 client = info.get('ws_client')
                 if not client or not client.is_connected():
-                    session_id = info.get('session_id') or str(uuid.uuid4())
-                    ws_url = config.build_ws_url(session_id)
                     # Get user token for usage tracking
                     user_token = self._get_user_token()
                     if token_required and not user_token:
@@ -2660,6 +2666,9 @@ class AgentController:
                             name,
                         )
                         return info
+                    session_id = info.get('session_id') or str(uuid.uuid4())
+                    # The URL only depends on the session id, so build it once per session
+                    ws_url = info.get('ws_url') or config.build_ws_url(session_id)
                     if not user_token:
                         logger.info("Reconnecting '%s' in auth-bypass mode (no auth token)", name)
                     new_client = FusionWebSocketClient(ws_url, user_token=user_token)
@@ -2678,6 +2687,7 @@ class AgentController:
                     new_client.add_state_handler(lambda connected, d=doc_id: self._on_ws_state(d, connected))
                     new_client.start()
                     info['ws_client'] = new_client
+                    info['ws_url'] = ws_url
                     if 'session_id' not in info:
                         info['session_id'] = session_id
                     logger.info(
@@ -2695,7 +2705,6 @@ class AgentController:
 
         # Create a new session for this document
         session_id = str(uuid.uuid4())
-        ws_url = config.build_ws_url(session_id)
         # Get user token for usage tracking
         user_token = self._get_user_token()
         if token_required and not user_token:
@@ -2718,6 +2727,7 @@ class AgentController:
             return info
         if not user_token:
             logger.info("Creating '%s' in auth-bypass mode (no auth token)", name)
+        ws_url = config.build_ws_url(session_id)
         client = FusionWebSocketClient(ws_url, user_token=user_token)
         # Set API keys for BYOK
         api_keys = self.get_api_keys_for_backend()
@@ -2749,6 +2759,7 @@ class AgentController:
 
         info = {
             'session_id': session_id,
+            'ws_url': ws_url,
             'ws_client': client,
             'created_at': time.time(),
             'last_active': time.time(),
@@ -2856,12 +2867,9 @@ class AgentController:
         self._auth_client.clear_session()
 
         # Close all WebSocket sessions
-        for doc_id, info in list(self._sessions.items()):
-            if info.get('ws_client'):
-                try:
-                    info['ws_client'].stop()
-                except Exception:
-                    pass
+        sessions = list(self._sessions.items())
+        self._stop_ws_clients(sessions)
+        for doc_id, _ in sessions:
             self._code_executor.reset_context(doc_id)
 
         # Clear sessions and reset state
@@ -2988,18 +2996,25 @@ class AgentController:
         has_keys, _ = api_key_manager.has_required_keys()
         return has_keys
 
-    def _send_api_keys_to_backend(self, doc_id: Optional[str], reason: str = "") -> bool:
+    def _send_api_keys_to_backend(
+        self,
+        doc_id: Optional[str],
+        reason: str = "",
+        keys: Optional[Dict[str, str]] = None,
+    ) -> bool:
         """
         Push locally stored API keys to the backend for a specific document/session.
 
         Args:
             doc_id: Target document id (falls back to active doc)
             reason: Optional log context for why this push is happening
+            keys: Backend-formatted keys already resolved by the caller (looked up if omitted)
 
         Returns:
             True if keys were sent to an active websocket client
         """
-        keys = self.get_api_keys_for_backend()
+        if keys is None:
+            keys = self.get_api_keys_for_backend()
         if not any(keys.values()):
             logger.info("[api_keys] Skipping push (%s): no stored keys", reason or "no reason")
             return False
@@ -3048,8 +3063,10 @@ class AgentController:
 
     def _push_api_keys_all_sessions(self, reason: str = "") -> None:
         """Push stored API keys to all active sessions (best effort)."""
+        # Resolve once for the whole batch rather than once per session
+        keys = self.get_api_keys_for_backend()
         for doc_id in list(self._sessions.keys()):
-            self._send_api_keys_to_backend(doc_id, reason=reason or "bulk")
+            self._send_api_keys_to_backend(doc_id, reason=reason or "bulk", keys=keys)
 
     # ------------------------------------------------------------------ Private Methods
     def _make_ws_handler(self, doc_id: str):
@@ -3208,7 +3225,7 @@ class AgentController:
                 logger.info(f"documentOpened/Created → {name} ({doc_id})")
                 # Lazy session creation on activation
         except Exception as e:
-            logger.debug(f"Open/create event handling skipped: {e}")
+            logger.debug("Open/create event handling skipped: %s", e)
 
     def on_workspace_activated(self, args: adsk.core.WorkspaceEventArgs) -> None:
         """
@@ -3283,7 +3300,7 @@ def run(context: Any) -> None:
     """
     try:
         global _app, _controller
-        _app = adsk.core.Application.get()
+        _app = general_utils.get_app()
         if not _app:
             return
 
@@ -3296,8 +3313,9 @@ def run(context: Any) -> None:
 
     except Exception as exc:
         logger.exception("Failed to start CADAgent add-in")
-        if _app and _app.userInterface:
-            _app.userInterface.messageBox(
+        ui = general_utils.get_ui()
+        if ui:
+            ui.messageBox(
                 f"Failed to start CADAgent add-in:\n\n{general_utils.format_exception(exc)}",
                 "CADAgent Startup Error",
                 adsk.core.MessageBoxButtonTypes.OKButtonType,
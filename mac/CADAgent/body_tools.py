@@ -60,8 +60,7 @@ def _collect_vertices(body: adsk.fusion.BRepBody) -> List[Dict[str, Any]]:
             }
             vertices.append(vertex_info)
     except Exception as exc:
-        import logging
-        logging.getLogger(__name__).debug("Failed to collect vertices: %s", exc)
+        logger.debug("Failed to collect vertices: %s", exc)
     return vertices
 
 
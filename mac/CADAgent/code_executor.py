@@ -84,21 +84,16 @@ class CodeExecutor:
 
             # Check if code set _result (e.g., from camera_tools.capture_screenshot)
             result_data = exec_globals.get("_result")
-            
-            # DEBUG: Log _result capture
-            logger.info("=== DEBUG code_executor ===")
-            logger.info("Operation: %s", operation)
-            logger.info("_result in exec_globals: %s", "_result" in exec_globals)
-            logger.info("result_data value: %s", result_data)
-            
+
+            # Only key names are logged: _result may carry a base64 screenshot, and
+            # formatting it on every successful operation is pure overhead.
             if result_data and isinstance(result_data, dict):
-                logger.info("_result is a dict with keys: %s", list(result_data.keys()))
+                logger.debug("Operation %s set _result with keys: %s", operation, list(result_data))
                 # Return the result data directly if it contains success info
                 if "success" in result_data:
                     result_data["operation"] = operation
                     if new_sketches:
                         result_data["created_sketches"] = new_sketches
-                    logger.info("Returning result_data directly: %s", result_data)
                     return result_data
                 # Otherwise merge with standard response
                 result = {
@@ -109,10 +104,7 @@ class CodeExecutor:
                 }
                 if new_sketches:
                     result["created_sketches"] = new_sketches
-                logger.info("Returning merged result: %s", result)
                 return result
-            else:
-                logger.info("No _result dict found, using standard response")
 
             result = {
                 "success": True,
@@ -123,9 +115,9 @@ class CodeExecutor:
                 result["created_sketches"] = new_sketches
             return result
         except Exception as exc:  # pragma: no cover - Fusion runtime errors are handled at runtime
-            # Capture full traceback for debugging context
+            # Capture full traceback for debugging context; formatted once and reused for the log
             tb = traceback.format_exc()
-            logger.exception("Failed to execute Fusion code for operation %s", operation)
+            logger.error("Failed to execute Fusion code for operation %s\n%s", operation, tb)
             return {
                 "success": False,
                 "operation": operation,
@@ -7,8 +7,13 @@ core code.
 """
 
 import os
+import re
 from pathlib import Path
 
+# KEY=VALUE lines of the .env file; comment lines, blank lines and lines
+# without '=' never match. Surrounding whitespace is excluded from both groups.
+_ENV_LINE_RE = re.compile(r'^[ \t]*([^#\s=][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t]*$', re.MULTILINE)
+
 def _strip_inline_env_comment(value: str) -> str:
     """Strip inline comments from unquoted env values."""
     in_single = False
@@ -26,30 +31,27 @@ def _strip_inline_env_comment(value: str) -> str:
 
 
 # Load .env.cadagent file before reading any config values
-def _load_env_file(path: Path) -> None:
-    """Load environment variables from .env.cadagent file."""
-    if not path.exists():
-        return
+def _load_env_file(path: Path) -> bool:
+    """Load environment variables from .env.cadagent file; return False if it doesn't exist."""
+    # Read directly instead of stat-ing first; a missing file is reported to the caller
     try:
-        for line in path.read_text().splitlines():
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            if '=' not in line:
+        for match in _ENV_LINE_RE.finditer(path.read_text()):
+            key, value = match.groups()
+            if key in os.environ:
                 continue
-            key, value = line.split('=', 1)
-            key = key.strip()
-            value = value.strip()
-            value = _strip_inline_env_comment(value)
-            value = value.strip('"').strip("'")
-            if key and key not in os.environ:
-                os.environ[key] = value
+            if '#' in value:
+                value = _strip_inline_env_comment(value)
+            os.environ[key] = value.strip('"').strip("'")
+    except FileNotFoundError:
+        return False
     except Exception:
         pass  # Silently fail if file can't be read
+    return True
 
 # Load environment from .env.cadagent file
-_env_file_path = Path(__file__).resolve().parent / ".env.cadagent"
-_load_env_file(_env_file_path)
+ENV_FILE_PATH = Path(__file__).resolve().parent / ".env.cadagent"
+# Whether the env file was found, so callers can warn without stat-ing it again
+ENV_FILE_LOADED = _load_env_file(ENV_FILE_PATH)
 
 # Debug mode - enable verbose logging
 DEBUG = os.environ.get("CADAGENT_DEBUG", "False").lower() == "true"
@@ -74,14 +76,10 @@ BACKEND_USE_SSL = os.environ.get("BACKEND_USE_SSL", "true").lower() == "true"
 BACKEND_URL = os.environ.get("BACKEND_URL")
 
 
-def build_ws_url(session_id: str) -> str:
-    """Return the full WebSocket URL for a given session id."""
+def _build_ws_url_prefix() -> str:
+    """Return the WebSocket URL up to (not including) the session id."""
     if BACKEND_URL:
-        # Allow templated or base URL
-        if "{session_id}" in BACKEND_URL:
-            return BACKEND_URL.format(session_id=session_id)
-        base = BACKEND_URL.rstrip("/")
-        return f"{base}/{session_id}"
+        return f"{BACKEND_URL.rstrip('/')}/"
 
     scheme = "wss" if BACKEND_USE_SSL else "ws"
     # Only include port if explicitly provided and non-default
@@ -90,7 +88,19 @@ def build_ws_url(session_id: str) -> str:
         if not ((scheme == "wss" and BACKEND_PORT in ("443", "")) or (scheme == "ws" and BACKEND_PORT == "80")):
             port = f":{BACKEND_PORT}"
 
-    return f"{scheme}://{BACKEND_HOST}{port}/ws/{session_id}"
+    return f"{scheme}://{BACKEND_HOST}{port}/ws/"
+
+
+# The backend settings are fixed at import, so only the session id varies per connection
+_WS_URL_TEMPLATED = bool(BACKEND_URL) and "{session_id}" in BACKEND_URL
+_WS_URL_PREFIX = _build_ws_url_prefix()
+
+
+def build_ws_url(session_id: str) -> str:
+    """Return the full WebSocket URL for a given session id."""
+    if _WS_URL_TEMPLATED:
+        return BACKEND_URL.format(session_id=session_id)
+    return f"{_WS_URL_PREFIX}{session_id}"
 
 
 def backend_label() -> str:
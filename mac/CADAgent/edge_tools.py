@@ -10,6 +10,7 @@ internal centimeter units.
 from __future__ import annotations
 
 import logging
+import math
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import adsk.core
@@ -56,7 +57,6 @@ def _get_edge_tangent_at_midpoint(edge: adsk.fusion.BRepEdge) -> Optional[List[f
         Normalized unit tangent vector [x, y, z], or None on failure.
     """
     try:
-        import math
         evaluator = edge.evaluator
         
         # Get parameter extents
@@ -218,7 +218,6 @@ def list_edges(
                 # Legacy direction (chord direction) as fallback
                 direction = None
                 if start_coords and end_coords:
-                    import math
                     dx = end_coords[0] - start_coords[0]
                     dy = end_coords[1] - start_coords[1]
                     dz = end_coords[2] - start_coords[2]
@@ -8,9 +8,10 @@ to maintain consistency with the user's working context.
 
 from __future__ import annotations
 
-import datetime
 import logging
 import math
+import re
+import time
 from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 import adsk.core
@@ -33,6 +34,11 @@ _CM_TO_MM = 10.0
 _HOLE_PLANE_TOL_CM = 0.02  # 0.2mm
 _HOLE_BBOX_TOL_CM = 0.02   # 0.2mm
 
+# Fusion hole failure signatures, compiled case-insensitively so classification
+# doesn't build a lowered copy of the exception text on every check.
+_MISSING_TARGET_BODY_ERROR_RE = re.compile("no target body found to cut or intersect", re.IGNORECASE)
+_LOGICAL_SELECTION_ERROR_RE = re.compile("logicalselection", re.IGNORECASE)
+
 
 class FeatureOperationError(RuntimeError):
     """Raised when a feature operation cannot be fulfilled."""
@@ -59,13 +65,11 @@ def _point_to_mm_dict(point_cm: adsk.core.Point3D) -> Dict[str, float]:
 
 
 def _is_missing_target_body_error(exc: Exception) -> bool:
-    message = str(exc).lower()
-    return "no target body found to cut or intersect" in message
+    return _MISSING_TARGET_BODY_ERROR_RE.search(str(exc)) is not None
 
 
 def _is_logical_selection_error(exc: Exception) -> bool:
-    message = str(exc).lower()
-    return "logicalselection" in message
+    return _LOGICAL_SELECTION_ERROR_RE.search(str(exc)) is not None
 
 
 def _diameter_to_cm(diameter: float, unit: str) -> float:
@@ -106,10 +110,12 @@ def _create_hole_cut_fallback(
     """Fallback for hole API selection failures: sketch circle + cut extrude."""
     radius_cm = _diameter_to_cm(diameter, diameter_unit) * 0.5
     sketch.sketchCurves.sketchCircles.addByCenterRadius(sketch_center, radius_cm)
-    if sketch.profiles.count <= 0:
+    profiles = sketch.profiles
+    profile_count = profiles.count
+    if profile_count <= 0:
         raise FeatureOperationError("Sketch-cut fallback failed: no profile was created.")
 
-    profile = sketch.profiles.item(sketch.profiles.count - 1)
+    profile = profiles.item(profile_count - 1)
     extrudes = component.features.extrudeFeatures
     cut_distance_cm = _fallback_cut_distance_cm(face)
 
@@ -253,6 +259,21 @@ def _validate_hole_center_on_face(
                 )
 
 
+def _face_owner_context(face: Any, root_component: adsk.fusion.Component) -> Tuple[Any, Any]:
+    """Return (component, occurrence) owning the face's native body, else (root_component, None).
+
+    Each attribute is read once via getattr(); hasattr() followed by a read would
+    fetch every Fusion property twice across the API bridge.
+    """
+    native_face = getattr(face, "nativeObject", None)
+    body = getattr(native_face, "body", None) if native_face else None
+    if body:
+        face_component = getattr(body, "parentComponent", None)
+        if face_component is not None:
+            return face_component, getattr(body, "assemblyContext", None)
+    return root_component, None
+
+
 def _preferred_through_all_direction(face: adsk.fusion.BRepFace) -> adsk.fusion.ExtentDirections:
     face_normal = _face_normal_vector(face)
     face_center = _face_center_point_cm(face)
@@ -335,7 +356,7 @@ def capture_feature_snapshot(design: Optional[adsk.fusion.Design], max_features:
         area_unit = f"{length_unit}^2"
         volume_unit = f"{length_unit}^3"
 
-    utc_now = datetime.datetime.utcnow()
+    utc_now = time.gmtime()
 
     feature_limit = max(1, min(int(max_features or 25), 100))
     features: List[Dict[str, Any]] = []
@@ -369,8 +390,8 @@ def capture_feature_snapshot(design: Optional[adsk.fusion.Design], max_features:
         "features": features,
         "timeline_count": timeline_count,
         "marker_position": marker_position,
-        "captured_at": utc_now.isoformat(timespec="seconds") + "Z",
-        "captured_at_label": utc_now.strftime("%Y-%m-%d %H:%M:%S UTC"),
+        "captured_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", utc_now),
+        "captured_at_label": time.strftime("%Y-%m-%d %H:%M:%S UTC", utc_now),
         "length_unit": length_unit,
         "area_unit": area_unit,
         "volume_unit": volume_unit,
@@ -1319,16 +1340,17 @@ def apply_fillet(
         logger.exception("Failed to create fillet feature")
         raise FeatureOperationError(f"Failed to apply fillet: {exc}") from exc
 
-    success_message = f"Applied fillet with {radius} {radius_unit} radius to {edge_collection.count} edge(s)"
+    edge_count = edge_collection.count
+    success_message = f"Applied fillet with {radius} {radius_unit} radius to {edge_count} edge(s)"
     if missing_tokens:
         success_message += f". {len(missing_tokens)} token(s) not found"
 
-    logger.info("Fillet applied successfully: %d edges", edge_collection.count)
+    logger.info("Fillet applied successfully: %d edges", edge_count)
 
     return {
         "success": True,
         "message": success_message,
-        "edge_count": edge_collection.count,
+        "edge_count": edge_count,
         "missing_tokens": missing_tokens,
         "radius": radius,
         "radius_unit": radius_unit,
@@ -1461,16 +1483,17 @@ def apply_chamfer(
         logger.exception("Failed to create chamfer feature")
         raise FeatureOperationError(f"Failed to apply chamfer: {exc}") from exc
 
-    success_message = f"Applied chamfer with {distance} {distance_unit} distance to {edge_collection.count} edge(s)"
+    edge_count = edge_collection.count
+    success_message = f"Applied chamfer with {distance} {distance_unit} distance to {edge_count} edge(s)"
     if missing_tokens:
         success_message += f". {len(missing_tokens)} token(s) not found"
 
-    logger.info("Chamfer applied successfully: %d edges", edge_collection.count)
+    logger.info("Chamfer applied successfully: %d edges", edge_count)
 
     return {
         "success": True,
         "message": success_message,
-        "edge_count": edge_collection.count,
+        "edge_count": edge_count,
         "missing_tokens": missing_tokens,
         "distance": distance,
         "distance_unit": distance_unit,
@@ -1728,13 +1751,14 @@ def create_shell(
         target_label = "entities"
     else:
         target_label = "faces" if faces else "bodies"
-    success_message = f"Created shell ({thickness_text}) on {entities_collection.count} {target_label}"
+    entity_count = entities_collection.count
+    success_message = f"Created shell ({thickness_text}) on {entity_count} {target_label}"
 
     return {
         "success": True,
         "message": success_message,
         "operation": "create_shell",
-        "entity_count": entities_collection.count,
+        "entity_count": entity_count,
         "entity_type": entity_type,
         "inside_thickness": inside_value,
         "outside_thickness": outside_value,
@@ -1802,22 +1826,8 @@ def create_simple_hole(
 
     # Determine the component that owns this face
     # If the face is a proxy from an occurrence, we need to work with that occurrence
-    face_component = None
-    face_occurrence = None
-
-    # Try to get the native entity and its component
-    if hasattr(face, 'nativeObject'):
-        native_face = face.nativeObject
-        if native_face and hasattr(native_face, 'body') and native_face.body:
-            if hasattr(native_face.body, 'assemblyContext'):
-                face_occurrence = native_face.body.assemblyContext
-            if hasattr(native_face.body, 'parentComponent'):
-                face_component = native_face.body.parentComponent
-
-    # Fallback to root component if we couldn't determine the component
-    if face_component is None:
-        face_component = root_component
-        face_occurrence = None
+    # Try to get the native entity and its component (falls back to the root component)
+    face_component, face_occurrence = _face_owner_context(face, root_component)
 
     # Create hole feature with proper cleanup
     temp_sketch = None
@@ -1847,10 +1857,12 @@ def create_simple_hole(
         except Exception:
             created_center_world_mm = None
 
+        # The diameter value is immutable and shared by every retry; a fresh HoleFeatureInput
+        # is still built per attempt since Fusion doesn't document reusing one after add() fails.
+        diameter_input = adsk.core.ValueInput.createByString(f"{diameter} {diameter_unit}")
+
         def _build_hole_input() -> adsk.fusion.HoleFeatureInput:
-            input_obj = holes.createSimpleInput(
-                adsk.core.ValueInput.createByString(f"{diameter} {diameter_unit}")
-            )
+            input_obj = holes.createSimpleInput(diameter_input)
             input_obj.setPositionBySketchPoint(sketch_point)
             return input_obj
 
@@ -1877,12 +1889,13 @@ def create_simple_hole(
                     break
                 except Exception as exc:
                     last_exception = exc
-                    if idx == 0 and (_is_missing_target_body_error(exc) or _is_logical_selection_error(exc)):
+                    missing_target_body = idx == 0 and _is_missing_target_body_error(exc)
+                    if idx == 0 and (missing_target_body or _is_logical_selection_error(exc)):
                         logger.info(
                             "Simple hole through_all retry with opposite direction "
                             "(first direction=%s, reason=%s).",
                             _through_direction_label(direction),
-                            "missing_target_body" if _is_missing_target_body_error(exc) else "logical_selection",
+                            "missing_target_body" if missing_target_body else "logical_selection",
                         )
                         continue
                     raise
@@ -2056,22 +2069,8 @@ def create_counterbore_hole(
 
     # Determine the component that owns this face
     # If the face is a proxy from an occurrence, we need to work with that occurrence
-    face_component = None
-    face_occurrence = None
-
-    # Try to get the native entity and its component
-    if hasattr(face, 'nativeObject'):
-        native_face = face.nativeObject
-        if native_face and hasattr(native_face, 'body') and native_face.body:
-            if hasattr(native_face.body, 'assemblyContext'):
-                face_occurrence = native_face.body.assemblyContext
-            if hasattr(native_face.body, 'parentComponent'):
-                face_component = native_face.body.parentComponent
-
-    # Fallback to root component if we couldn't determine the component
-    if face_component is None:
-        face_component = root_component
-        face_occurrence = None
+    # Try to get the native entity and its component (falls back to the root component)
+    face_component, face_occurrence = _face_owner_context(face, root_component)
 
     # Create counterbore hole feature with proper cleanup
     temp_sketch = None
@@ -2242,20 +2241,7 @@ def create_tapped_hole(
     center_point = _point_from_mm(center_x, center_y, center_z)
     _validate_hole_center_on_face(face, center_point, (center_x, center_y, center_z))
 
-    face_component = None
-    face_occurrence = None
-    if hasattr(face, "nativeObject"):
-        native_face = face.nativeObject
-        if native_face and hasattr(native_face, "body") and native_face.body:
-            body = native_face.body
-            if hasattr(body, "assemblyContext"):
-                face_occurrence = body.assemblyContext
-            if hasattr(body, "parentComponent"):
-                face_component = body.parentComponent
-
-    if face_component is None:
-        face_component = root_component
-        face_occurrence = None
+    face_component, face_occurrence = _face_owner_context(face, root_component)
 
     tap_drill_in_unit = _convert_length_units(thread_spec.tap_drill_diameter, "mm", diameter_unit)
     tap_drill_text = f"{tap_drill_in_unit:.4f}".rstrip("0").rstrip(".")
@@ -2445,20 +2431,7 @@ def create_external_thread(
         raise FeatureOperationError(f"Failed to validate face geometry: {exc}") from exc
 
     # Determine component context
-    face_component = None
-    face_occurrence = None
-    if hasattr(face, "nativeObject"):
-        native_face = face.nativeObject
-        if native_face and hasattr(native_face, "body") and native_face.body:
-            body = native_face.body
-            if hasattr(body, "assemblyContext"):
-                face_occurrence = body.assemblyContext
-            if hasattr(body, "parentComponent"):
-                face_component = body.parentComponent
-
-    if face_component is None:
-        face_component = root_component
-        face_occurrence = None
+    face_component, face_occurrence = _face_owner_context(face, root_component)
 
     # Convert nominal diameter to target unit for reporting
     nominal_in_unit = _convert_length_units(thread_spec.nominal_diameter, "mm", diameter_unit)
@@ -2614,7 +2587,8 @@ def _find_thread_info(app: adsk.core.Application, thread_spec: thread_database.T
     # Step 1: Query available sizes for this thread type
     try:
         all_sizes = thread_data_query.allSizes(thread_type)
-        logger.info(f"Available sizes for '{thread_type}': {list(all_sizes)[:10]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Available sizes for '%s': %s", thread_type, list(all_sizes)[:10])
     except Exception as exc:
         raise FeatureOperationError(f"Failed to query thread sizes: {exc}") from exc
 
@@ -2660,7 +2634,8 @@ def _find_thread_info(app: adsk.core.Application, thread_spec: thread_database.T
     # Step 3: Query available designations for this size
     try:
         all_designations = thread_data_query.allDesignations(thread_type, target_size)
-        logger.info(f"Available designations for size '{target_size}': {list(all_designations)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Available designations for size '%s': %s", target_size, list(all_designations))
     except Exception as exc:
         raise FeatureOperationError(
             f"Failed to query thread designations for size '{target_size}': {exc}"
@@ -2699,7 +2674,8 @@ def _find_thread_info(app: adsk.core.Application, thread_spec: thread_database.T
     # Step 5: Query available classes for this designation
     try:
         all_classes = thread_data_query.allClasses(is_internal, thread_type, target_designation)
-        logger.info(f"Available classes for '{target_designation}': {list(all_classes)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Available classes for '%s': %s", target_designation, list(all_classes))
     except Exception as exc:
         raise FeatureOperationError(
             f"Failed to query thread classes for '{target_designation}': {exc}"
@@ -2803,28 +2779,36 @@ def create_pattern_feature(
     root_comp = design.rootComponent
     timeline = design.timeline
 
-    # Resolve feature tokens to timeline objects
-    resolved_features = adsk.core.ObjectCollection.create()
-    for token in feature_tokens:
-        found = False
+    # Resolve feature tokens to timeline objects in a single timeline walk; each
+    # item/entity access crosses into Fusion, so stop once every token is found
+    pending_tokens = {token for token in feature_tokens if token}
+    entities_by_token: Dict[str, Any] = {}
+    if pending_tokens:
         for i in range(timeline.count):
-            timeline_obj = timeline.item(i)
-            if timeline_obj.entity and hasattr(timeline_obj.entity, 'entityToken'):
-                if timeline_obj.entity.entityToken == token:
-                    resolved_features.add(timeline_obj.entity)
-                    found = True
+            entity = timeline.item(i).entity
+            token = getattr(entity, 'entityToken', None) if entity else None
+            if token in pending_tokens:
+                entities_by_token[token] = entity
+                pending_tokens.discard(token)
+                if not pending_tokens:
                     break
-        if not found:
+
+    resolved_entities: List[Any] = []
+    resolved_features = adsk.core.ObjectCollection.create()
+    for token in feature_tokens:
+        entity = entities_by_token.get(token)
+        if entity is None:
             raise FeatureOperationError(f"Could not resolve feature token: {token}")
+        resolved_entities.append(entity)
+        resolved_features.add(entity)
 
-    if resolved_features.count == 0:
+    if not resolved_entities:
         raise FeatureOperationError("No features resolved for patterning.")
 
     # Determine which component owns these features
     # All features must belong to the same component
     feature_component = None
-    for i in range(resolved_features.count):
-        feature = resolved_features.item(i)
+    for feature in resolved_entities:
         comp = getattr(feature, "parentComponent", None)
         if comp is None:
             comp = root_comp
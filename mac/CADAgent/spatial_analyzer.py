@@ -109,7 +109,7 @@ def _compute_workspace_bounds(bodies: List[adsk.fusion.BRepBody]) -> Optional[Di
             ]
         }
     except Exception as e:
-        logger.debug(f"Failed to compute workspace bounds: {e}")
+        logger.debug("Failed to compute workspace bounds: %s", e)
         return None
 
 
@@ -131,11 +131,9 @@ def _find_parallel_face_groups(component: adsk.fusion.Component) -> List[Dict[st
                 if geometry and geometry.surfaceType == adsk.core.SurfaceTypes.PlaneSurfaceType:
                     normal = geometry.normal
                     planar_faces.append({
-                        "face": face,
                         "token": face.entityToken,
                         "normal": [normal.x, normal.y, normal.z],
                         "centroid": face.centroid,
-                        "area": face.area
                     })
 
         # Group faces by parallel normals (threshold: within 1 degree)
@@ -151,6 +149,7 @@ def _find_parallel_face_groups(component: adsk.fusion.Component) -> List[Dict[st
                 "faces": [face_a["token"]],
                 "count": 1
             }
+            first_match = None  # index of the first parallel partner (used for spacing)
 
             # Find all faces parallel to this one
             for j, face_b in enumerate(planar_faces):
@@ -164,6 +163,8 @@ def _find_parallel_face_groups(component: adsk.fusion.Component) -> List[Dict[st
                     group["faces"].append(face_b["token"])
                     group["count"] += 1
                     processed.add(j)
+                    if first_match is None:
+                        first_match = j
 
             processed.add(i)
 
@@ -172,7 +173,7 @@ def _find_parallel_face_groups(component: adsk.fusion.Component) -> List[Dict[st
                 # Add spacing information for most common case (2 parallel faces)
                 if group["count"] == 2:
                     face_data_a = planar_faces[i]
-                    face_data_b = next(f for f in planar_faces if f["token"] == group["faces"][1])
+                    face_data_b = planar_faces[first_match]
 
                     distance = _point_to_plane_distance(
                         face_data_b["centroid"],
@@ -185,7 +186,7 @@ def _find_parallel_face_groups(component: adsk.fusion.Component) -> List[Dict[st
 
                 parallel_groups.append(group)
 
-        logger.debug(f"Found {len(parallel_groups)} parallel face groups")
+        logger.debug("Found %d parallel face groups", len(parallel_groups))
         return parallel_groups
 
     except Exception as e:
@@ -7,6 +7,7 @@ Fusion add-in can translate high-level requests into concrete thread settings.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
@@ -176,10 +177,14 @@ _THREAD_TYPE_ALIASES = {
 }
 
 
+# Whitespace, underscores and hyphens are all dropped from thread type names in one pass
+_THREAD_TYPE_SEPARATORS_RE = re.compile(r"[\s_-]+")
+
+
 def _normalize_thread_type(thread_type: str) -> Optional[str]:
     if not thread_type:
         return None
-    key = "".join(ch for ch in thread_type.lower() if not ch.isspace()).replace("_", "").replace("-", "")
+    key = _THREAD_TYPE_SEPARATORS_RE.sub("", thread_type.lower())
     return _THREAD_TYPE_ALIASES.get(key)
 
 
@@ -11,10 +11,11 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import math
 import os
 import sys
 import threading
-from typing import Callable, List, Optional
+from typing import Any, Callable, List, Optional, Tuple
 
 # Add bundled websockets to path if not already available
 try:
@@ -26,17 +27,88 @@ except ImportError:
         sys.path.insert(0, lib_path)
     import websockets
 
+from . import config
+
 logger = logging.getLogger(__name__)
 
+# Shared compact encoder for outgoing frames: request payloads carry large entity and
+# snapshot blocks, and default separators pad every item with a space. NaN/Infinity
+# raise here instead of becoming non-standard tokens; see _encode_json.
+_stdlib_encode_json = json.JSONEncoder(separators=(',', ':'), allow_nan=False).encode
+
+# orjson encodes and parses frames when the host Python provides it; it is a compiled
+# extension, so it can't be bundled in lib/ and the stdlib codec is the default.
+try:
+    from orjson import OPT_NON_STR_KEYS as _ORJSON_DUMPS_OPTS
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as _orjson_loads
+except ImportError:
+    _orjson_dumps = None
+    _decode_json = json.loads
+else:
+    def _decode_json(text: Any) -> Any:
+        """Parse a frame with orjson, deferring to json.loads for what orjson rejects."""
+        try:
+            return _orjson_loads(text)
+        except ValueError:
+            # orjson refuses the NaN/Infinity tokens json.loads accepts; a genuinely
+            # malformed frame fails again here with json.JSONDecodeError for the receiver
+            return json.loads(text)
+
+
+def _null_non_finite(value: Any) -> Any:
+    """Return a copy of value with NaN and +/-Infinity floats replaced by None."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _null_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_null_non_finite(item) for item in value]
+    return value
+
+
+def _encode_json(payload: Any) -> str:
+    """
+    Encode an outgoing frame compactly, preferring orjson when it is available.
+
+    Frames are strict JSON on both paths: NaN and +/-Infinity floats go out as null
+    rather than the non-standard NaN/Infinity tokens, so a backend that parses
+    strictly never rejects a frame over a degenerate measurement. orjson does this
+    natively; the stdlib path re-encodes a sanitized copy only when such a value is
+    present. The paths still differ in one way: the stdlib escapes non-ASCII text as
+    \\uXXXX, where orjson writes UTF-8; both parse to the same value.
+    """
+    if _orjson_dumps is not None:
+        try:
+            return _orjson_dumps(payload, option=_ORJSON_DUMPS_OPTS).decode("utf-8")
+        except TypeError:
+            # orjson.JSONEncodeError (a TypeError) covers values it rejects, such as
+            # integers wider than 64 bits; the stdlib encoder still handles those.
+            pass
+    try:
+        return _stdlib_encode_json(payload)
+    except ValueError as exc:
+        # A circular payload raises ValueError too and has no finite copy to encode
+        if "Circular reference" in str(exc):
+            raise
+        return _stdlib_encode_json(_null_non_finite(payload))
+
+
+# Fusion Application pinned after the first probe; adsk is only importable inside Fusion,
+# so it is resolved lazily instead of at module import.
+_probe_app: Optional[Any] = None
+
 
 def _fusion_log_probe(message: str) -> None:
     """Best-effort bridge to Fusion's Text Command log for field diagnostics."""
+    global _probe_app
     try:
-        import adsk.core  # type: ignore
+        if _probe_app is None:
+            import adsk.core  # type: ignore
 
-        app = adsk.core.Application.get()
-        if app:
-            app.log(message)
+            _probe_app = adsk.core.Application.get()
+        if _probe_app:
+            _probe_app.log(message)
     except Exception:
         # Swallow any Fusion logging failures; we don't want telemetry to crash the add-in.
         pass
@@ -49,6 +121,10 @@ class FusionWebSocketClient:
         self._url = url
         self._user_token = user_token
         self._api_keys = api_keys or {}  # BYOK: User's API keys for LLM providers
+        # (token, api_keys, frame): the encoded authenticate frame together with the exact
+        # token and keys dict it was built from. Setters run on the UI thread while the loop
+        # thread encodes, so the inputs are compared on use instead of relying on a reset.
+        self._auth_frame: Optional[Tuple[Optional[str], dict, str]] = None
         self._loop = asyncio.new_event_loop()
         self._thread = threading.Thread(
             target=self._run_loop,
@@ -87,10 +163,14 @@ class FusionWebSocketClient:
 
     def send_json(self, payload: dict) -> None:
         """Send a JSON payload to the backend asynchronously."""
+        self._send_text(_encode_json(payload))
+
+    def _send_text(self, text: str) -> None:
+        """Send an already-encoded JSON frame and wait for it to be written."""
         async def _send():
             if not self._websocket:
                 raise ConnectionError("WebSocket is not connected.")
-            await self._websocket.send(json.dumps(payload))
+            await self._websocket.send(text)
 
         future = asyncio.run_coroutine_threadsafe(_send(), self._loop)
         future.result()
@@ -118,7 +198,11 @@ class FusionWebSocketClient:
         Args:
             api_keys: Dictionary with keys like 'anthropic_api_key', 'openai_api_key'
         """
-        self._api_keys = api_keys or {}
+        api_keys = api_keys or {}
+        if api_keys == self._api_keys:
+            # Unchanged keys are already in the authenticate frame this connection sent
+            return
+        self._api_keys = api_keys
         logger.info(
             "[api_keys] Client keys set anthropic=%s openai=%s google=%s",
             bool(self._api_keys.get("anthropic_api_key")),
@@ -130,16 +214,27 @@ class FusionWebSocketClient:
             self._send_auth_message()
             logger.info("Sent authentication update with API keys")
 
-    def _send_auth_message(self) -> None:
-        """Send authentication message with token and API keys."""
-        auth_payload = {
+    def _encoded_auth_payload(self) -> str:
+        """Return the authenticate frame, encoding it once per token/keys change."""
+        token = self._user_token
+        api_keys = self._api_keys
+        cached = self._auth_frame
+        # set_api_keys always installs a new dict, so identity tracks a keys change
+        if cached is not None and cached[0] == token and cached[1] is api_keys:
+            return cached[2]
+        frame = _encode_json({
             "type": "authenticate",
-            "token": self._user_token,
-            "api_keys": self._api_keys,
+            "token": token,
+            "api_keys": api_keys,
             # Compatibility: newer backends expect llm_api_keys
-            "llm_api_keys": self._api_keys,
-        }
-        self.send_json(auth_payload)
+            "llm_api_keys": api_keys,
+        })
+        self._auth_frame = (token, api_keys, frame)
+        return frame
+
+    def _send_auth_message(self) -> None:
+        """Send authentication message with token and API keys."""
+        self._send_text(self._encoded_auth_payload())
 
     # Internal helpers -----------------------------------------------------
     def _run_loop(self) -> None:
@@ -161,24 +256,17 @@ class FusionWebSocketClient:
             self._notify_state(True)
 
             # Send authentication message. Token is optional for anonymous sessions.
-            auth_payload = {
-                "type": "authenticate",
-                "token": self._user_token,
-                "api_keys": self._api_keys,
-                # Compatibility: newer backends expect llm_api_keys
-                "llm_api_keys": self._api_keys,
-            }
             logger.info(
                 "[api_keys] Sending authenticate with keys anthropic=%s openai=%s google=%s",
                 bool(self._api_keys.get("anthropic_api_key")),
                 bool(self._api_keys.get("openai_api_key")),
                 bool(self._api_keys.get("google_api_key")),
             )
-            await self._websocket.send(json.dumps(auth_payload))
+            await self._websocket.send(self._encoded_auth_payload())
             logger.info(
                 "Sent authentication (authenticated=%s) with %d API keys",
                 bool(self._user_token),
-                len([k for k, v in self._api_keys.items() if v]),
+                sum(1 for v in self._api_keys.values() if v),
             )
 
             asyncio.create_task(self._receiver())
@@ -191,15 +279,19 @@ class FusionWebSocketClient:
         try:
             async for message in self._websocket:
                 try:
-                    payload = json.loads(message)
+                    payload = _decode_json(message)
                 except json.JSONDecodeError:
-                    logger.error("Received non-JSON message: %s", message)
+                    # Only a prefix is logged; a malformed frame can be an arbitrarily large payload
+                    logger.error("Received non-JSON message (%d chars): %.200s", len(message), message)
                     continue
 
                 # INSTRUMENTATION: Track message arrival in WS pipeline
                 msg_type = payload.get("type", "<no type>")
-                logger.info(f"[WS_RECEIVE] Message received: type={msg_type}")
-                _fusion_log_probe(f"[WS_RECEIVE] type={msg_type}")
+                logger.debug("[WS_RECEIVE] Message received: type=%s", msg_type)
+                # Per-message Text Commands probes are debug-only: streaming responses
+                # arrive as many small chunks and each app.log crosses the Fusion bridge.
+                if config.DEBUG:
+                    _fusion_log_probe(f"[WS_RECEIVE] type={msg_type}")
 
                 # NOTE: This background thread must not touch adsk.* APIs; it only
                 # queues data and signals the main thread through handlers.
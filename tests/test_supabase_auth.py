@@ -0,0 +1,55 @@
+"""Tests for CADAgent.supabase_auth session handling."""
+
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "mac"))
+
+from CADAgent import supabase_auth  # noqa: E402
+
+
+class ClearSessionDuringRefreshTests(unittest.TestCase):
+    def setUp(self):
+        self._home = tempfile.TemporaryDirectory()
+        with mock.patch.object(Path, "home", return_value=Path(self._home.name)):
+            self.client = supabase_auth.SupabaseAuthClient("https://example.supabase.co", "anon-key")
+        self.session = supabase_auth.SimpleSession("old-access", "old-refresh", expires_at=0)
+        self.client._session = self.session
+        self.client.save_session(self.session)
+        self.refresh_started = threading.Event()
+        self.release_refresh = threading.Event()
+
+    def tearDown(self):
+        self.client.close()
+        self._home.cleanup()
+
+    def _blocking_refresh(self, refresh_token, *, background=False):
+        self.refresh_started.set()
+        self.release_refresh.wait(5)
+        return supabase_auth.SimpleSession("new-access", "new-refresh", expires_at=0)
+
+    def _assert_logout_wins(self, target):
+        with mock.patch.object(self.client, "_refresh_session", side_effect=self._blocking_refresh):
+            worker = threading.Thread(target=target)
+            worker.start()
+            self.assertTrue(self.refresh_started.wait(5))
+            self.client.clear_session()
+            self.release_refresh.set()
+            worker.join(5)
+        self.assertFalse(worker.is_alive())
+        self.assertIsNone(self.client._session)
+        self.assertFalse(self.client.session_file.exists())
+
+    def test_background_refresh_does_not_restore_cleared_session(self):
+        self._assert_logout_wins(lambda: self.client._background_refresh(self.session))
+
+    def test_exclusive_refresh_does_not_restore_cleared_session(self):
+        self._assert_logout_wins(lambda: self.client._refresh_exclusive(self.session))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""Tests for CADAgent.websocket_client frame encoding."""
+
+import json
+import math
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "mac"))
+
+from CADAgent import websocket_client  # noqa: E402
+
+
+class EncodeJsonTests(unittest.TestCase):
+    PAYLOAD = {
+        "type": "measurement",
+        "values": [1.5, math.nan, math.inf],
+        "bounds": {"min": -math.inf, "max": 2, "points": (0.0, math.nan)},
+    }
+
+    def test_stdlib_path_emits_strict_json(self):
+        with mock.patch.object(websocket_client, "_orjson_dumps", None):
+            frame = websocket_client._encode_json(self.PAYLOAD)
+        self.assertEqual(
+            json.loads(frame, parse_constant=self.fail),
+            {
+                "type": "measurement",
+                "values": [1.5, None, None],
+                "bounds": {"min": None, "max": 2, "points": [0.0, None]},
+            },
+        )
+
+    @unittest.skipIf(websocket_client._orjson_dumps is None, "orjson is not installed")
+    def test_orjson_and_stdlib_paths_produce_the_same_frame(self):
+        orjson_frame = websocket_client._encode_json(self.PAYLOAD)
+        with mock.patch.object(websocket_client, "_orjson_dumps", None):
+            stdlib_frame = websocket_client._encode_json(self.PAYLOAD)
+        self.assertEqual(orjson_frame, stdlib_frame)
+
+    def test_circular_payload_still_raises(self):
+        payload = {}
+        payload["self"] = payload
+        with mock.patch.object(websocket_client, "_orjson_dumps", None):
+            with self.assertRaises(ValueError):
+                websocket_client._encode_json(payload)
+
+
+if __name__ == "__main__":
+    unittest.main()
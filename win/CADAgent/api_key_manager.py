@@ -14,11 +14,15 @@ Security considerations:
 import json
 import logging
 import os
+import time
 from pathlib import Path
 from typing import Dict, Optional, Any
 
 logger = logging.getLogger(__name__)
 
+# How long an unreadable keys file is treated as "no keys" before it is read again
+_FAILED_LOAD_RETRY_SECONDS = 30.0
+
 
 class APIKeyManager:
     """
@@ -34,9 +38,9 @@ class APIKeyManager:
     
     # Supported providers and their key prefixes for validation
     PROVIDER_PREFIXES = {
-        "anthropic_api_key": ["sk-ant-"],
-        "openai_api_key": ["sk-proj-", "sk-"],
-        "google_api_key": ["AIza"],
+        "anthropic_api_key": ("sk-ant-",),
+        "openai_api_key": ("sk-proj-", "sk-"),
+        "google_api_key": ("AIza",),
     }
     
     def __init__(self, config_dir: Optional[Path] = None):
@@ -52,6 +56,10 @@ class APIKeyManager:
             self.config_dir = config_dir
             
         self.keys_file = self.config_dir / "api_keys.json"
+        # Parsed keys file, kept in memory until this manager writes the file again
+        self._cached_keys: Optional[Dict[str, str]] = None
+        # Set only when the cache holds a negative result from a failed load
+        self._cached_keys_expires_at: Optional[float] = None
         self._ensure_config_dir()
         
         logger.info(f"APIKeyManager initialized with config dir: {self.config_dir}")
@@ -82,29 +90,46 @@ class APIKeyManager:
         Returns:
             Dictionary mapping key names to values
         """
+        if self._cached_keys is not None:
+            expires_at = self._cached_keys_expires_at
+            if expires_at is None or time.monotonic() < expires_at:
+                return dict(self._cached_keys)
+            self._cached_keys = None
+            self._cached_keys_expires_at = None
+
         try:
-            if not self.keys_file.exists():
+            # Open directly rather than stat-ing first; a missing file is the common first-run case
+            try:
+                with open(self.keys_file, 'r') as f:
+                    data = json.load(f)
+            except FileNotFoundError:
                 logger.debug("No API keys file found")
+                self._cached_keys = {}
                 return {}
             
-            with open(self.keys_file, 'r') as f:
-                data = json.load(f)
-            
             # Only return recognized key fields
             keys = {}
             for key_name in self.PROVIDER_PREFIXES.keys():
                 if key_name in data and data[key_name]:
                     keys[key_name] = data[key_name]
             
-            logger.debug(f"Loaded {len(keys)} API key(s)")
+            logger.debug("Loaded %d API key(s)", len(keys))
+            self._cached_keys = dict(keys)
             return keys
             
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse API keys file: {e}")
+            self._cache_failed_load()
             return {}
         except Exception as e:
             logger.error(f"Failed to load API keys: {e}")
+            self._cache_failed_load()
             return {}
+
+    def _cache_failed_load(self) -> None:
+        """Remember a failed load briefly so repeated lookups don't re-read a bad file."""
+        self._cached_keys = {}
+        self._cached_keys_expires_at = time.monotonic() + _FAILED_LOAD_RETRY_SECONDS
     
     def get_key(self, key_name: str) -> Optional[str]:
         """
@@ -130,50 +155,60 @@ class APIKeyManager:
         Returns:
             True if successful, False otherwise
         """
-        if key_name not in self.PROVIDER_PREFIXES:
-            logger.error(f"Unknown key name: {key_name}")
-            return False
+        return self.set_keys({key_name: key_value})
+    
+    def set_keys(self, keys: Dict[str, str]) -> bool:
+        """
+        Store multiple API keys at once.
+        
+        Recognized keys are merged and written to the keys file in one rewrite.
+        
+        Args:
+            keys: Dictionary mapping key names to values (empty value deletes the key)
+            
+        Returns:
+            True if all keys were saved successfully
+        """
+        success = True
+        updates: Dict[str, str] = {}
+        for key_name, key_value in keys.items():
+            if key_name not in self.PROVIDER_PREFIXES:
+                logger.error(f"Unknown key name: {key_name}")
+                success = False
+                continue
+            updates[key_name] = key_value
+        if not updates:
+            return success
         
         try:
             # Load existing keys
-            keys = self.get_all_keys()
+            stored = self.get_all_keys()
             
-            # Update the key
-            if key_value:
-                keys[key_name] = key_value.strip()
-            elif key_name in keys:
-                del keys[key_name]
+            # Apply the updates
+            for key_name, key_value in updates.items():
+                if key_value:
+                    stored[key_name] = key_value.strip()
+                elif key_name in stored:
+                    del stored[key_name]
             
             # Save to file
             with open(self.keys_file, 'w') as f:
-                json.dump(keys, f, indent=2)
+                json.dump(stored, f, indent=2)
+            self._cached_keys = dict(stored)
+            self._cached_keys_expires_at = None
             
             # Set restrictive permissions
             self._set_file_permissions(self.keys_file)
             
-            logger.info(f"Saved API key: {key_name}")
-            return True
+            logger.info(f"Saved API key(s): {', '.join(updates)}")
+            return success
             
         except Exception as e:
+            self._cached_keys = None
+            self._cached_keys_expires_at = None
             logger.error(f"Failed to save API key: {e}")
             return False
     
-    def set_keys(self, keys: Dict[str, str]) -> bool:
-        """
-        Store multiple API keys at once.
-        
-        Args:
-            keys: Dictionary mapping key names to values
-            
-        Returns:
-            True if all keys were saved successfully
-        """
-        success = True
-        for key_name, key_value in keys.items():
-            if not self.set_key(key_name, key_value):
-                success = False
-        return success
-    
     def delete_key(self, key_name: str) -> bool:
         """
         Delete an API key.
@@ -194,11 +229,14 @@ class APIKeyManager:
             True if successful
         """
         try:
-            if self.keys_file.exists():
-                self.keys_file.unlink()
+            self.keys_file.unlink(missing_ok=True)
+            self._cached_keys = {}
+            self._cached_keys_expires_at = None
             logger.info("Deleted all API keys")
             return True
         except Exception as e:
+            self._cached_keys = None
+            self._cached_keys_expires_at = None
             logger.error(f"Failed to delete API keys: {e}")
             return False
     
@@ -223,7 +261,7 @@ class APIKeyManager:
         
         # Check prefix
         prefixes = self.PROVIDER_PREFIXES[key_name]
-        if not any(key_value.startswith(p) for p in prefixes):
+        if not key_value.startswith(prefixes):
             expected = " or ".join(prefixes)
             return False, f"Invalid key format. Expected to start with: {expected}"
         
@@ -265,11 +303,7 @@ class APIKeyManager:
             Dictionary with keys ready for WebSocket auth message
         """
         keys = self.get_all_keys()
-        return {
-            "anthropic_api_key": keys.get("anthropic_api_key", ""),
-            "openai_api_key": keys.get("openai_api_key", ""),
-            "google_api_key": keys.get("google_api_key", ""),
-        }
+        return {key_name: keys.get(key_name, "") for key_name in self.PROVIDER_PREFIXES}
     
     def get_status(self) -> Dict[str, Any]:
         """
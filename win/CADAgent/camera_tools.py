@@ -11,15 +11,48 @@ Based on CameraExplorer test add-in implementation.
 import adsk.core
 import adsk.fusion
 import logging
+import mmap
+import os
 import tempfile
 import base64
 import time
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 
+from . import general_utils
+
+# pybase64 (SIMD codec) is used when the host Python happens to provide it; it is a
+# compiled extension, so it can't be bundled in lib/ and the stdlib codec is the default.
+# b64encode_as_string emits the str directly, skipping the intermediate bytes object.
+try:
+    from pybase64 import b64encode_as_string as _b64encode_as_string
+except ImportError:
+    def _b64encode_as_string(data: bytes) -> str:
+        return base64.b64encode(data).decode("ascii")
+
 logger = logging.getLogger(__name__)
 
 
+def encode_image_base64(image_bytes: bytes) -> str:
+    """Base64-encode captured image bytes as an ASCII string for JSON payloads."""
+    return _b64encode_as_string(image_bytes)
+
+
+def encode_image_file(file_path: Path) -> str:
+    """
+    Base64-encode an image file for JSON payloads.
+
+    The file is memory-mapped and encoded in place, so only the encoded string is
+    allocated (no intermediate bytes copy of the whole image). The mapping is closed
+    before returning, so callers can delete the file straight away (required on Windows).
+    """
+    with open(file_path, "rb") as image_file:
+        if os.fstat(image_file.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return encode_image_base64(mapped)
+
+
 def save_camera_state(app: adsk.core.Application) -> Optional[adsk.core.Camera]:
     """
     Save the current camera state for later restoration.
@@ -175,27 +208,27 @@ def capture_screenshot_internal(
             logger.warning("No active viewport found")
             return None
 
-        # Create temporary file
-        temp_file = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
-        tmp_file_path = Path(temp_file.name)
-        temp_file.close()
-
-        # Save viewport as image
-        success = viewport.saveAsImageFile(str(tmp_file_path), width, height)
-
-        if not success:
-            logger.error("Failed to save viewport as image")
-            return None
-
-        # Read image and encode as base64
-        image_bytes = tmp_file_path.read_bytes()
-        encoded_image = base64.b64encode(image_bytes).decode("ascii")
+        # Reserve a temporary path (Fusion writes the file itself)
+        fd, tmp_name = tempfile.mkstemp(suffix=".png")
+        os.close(fd)
+        tmp_file_path = Path(tmp_name)
 
-        # Clean up temp file
         try:
-            tmp_file_path.unlink()
-        except:
-            pass
+            # Save viewport as image
+            success = viewport.saveAsImageFile(str(tmp_file_path), width, height)
+
+            if not success:
+                logger.error("Failed to save viewport as image")
+                return None
+
+            # Encode image as base64
+            encoded_image = encode_image_file(tmp_file_path)
+        finally:
+            # Clean up temp file, including when the capture or encode failed
+            try:
+                tmp_file_path.unlink()
+            except OSError:
+                pass
 
         # Get current camera info
         camera_info = get_camera_info(app)
@@ -334,7 +367,7 @@ def capture_screenshot(
     """
     try:
         # Get Fusion application
-        app = adsk.core.Application.get()
+        app = general_utils.get_app()
 
         logger.info(f"Capturing screenshot: eye=({eye_x}, {eye_y}, {eye_z}), target=({target_x}, {target_y}, {target_z})")
 
@@ -9,6 +9,7 @@ LLM can reason about selections without embedding raw Fusion API usage.
 from __future__ import annotations
 
 import logging
+import math
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import adsk.core
@@ -56,7 +57,6 @@ def _extract_face_frame(face: adsk.fusion.BRepFace) -> Optional[Dict[str, List[f
         n is the surface normal, negated if face.isParamReversed is True.
     """
     try:
-        import math
         p = face.pointOnFace
         se = face.evaluator
         
@@ -231,8 +231,8 @@ def list_faces(
                             
                 except Exception as exc:  # pragma: no cover - defensive for geometry extraction
                     logger.warning("Failed to extract geometry-specific data for face %s: %s", face_index, exc)
-                    import traceback
-                    logger.warning("Traceback: %s", traceback.format_exc())
+                    # Traceback is only formatted when debug logging is enabled
+                    logger.debug("Traceback for face %s", face_index, exc_info=True)
 
                 faces.append(face_info)
 
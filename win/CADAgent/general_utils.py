@@ -7,6 +7,7 @@ startup failures when the original helper module was removed.
 
 from __future__ import annotations
 
+import functools
 import logging
 import traceback
 from typing import Optional
@@ -15,11 +16,39 @@ import adsk.core
 
 SUPPORT_CONTACT_LINE = "If issue persists, email erik@cadagent.co"
 
+# Fusion's Application is a process-wide singleton; fetched once and reused.
+_app: Optional[adsk.core.Application] = None
+_ui: Optional[adsk.core.UserInterface] = None
 
-def _append_support_contact(message: str) -> str:
+
+def get_app() -> Optional[adsk.core.Application]:
+    """Return the Fusion Application, caching it after the first successful lookup."""
+    global _app
+    if _app is None:
+        _app = adsk.core.Application.get()
+    return _app
+
+
+def get_ui() -> Optional[adsk.core.UserInterface]:
+    """Return the Fusion UserInterface, cached alongside the Application."""
+    global _ui
+    if _ui is None:
+        app = get_app()
+        _ui = app.userInterface if app else None
+    return _ui
+
+
+# Lowered once for the case-insensitive "already appended" check
+_SUPPORT_CONTACT_LINE_LOWER = SUPPORT_CONTACT_LINE.lower()
+
+
+# Error cascades repeat the same messages (reconnect failures, auth errors), so results are memoized
+@functools.lru_cache(maxsize=256)
+def append_support_contact(message: str) -> str:
+    """Return message with the support contact line appended, unless it already has one."""
     if not message:
         return SUPPORT_CONTACT_LINE
-    if SUPPORT_CONTACT_LINE.lower() in message.lower():
+    if _SUPPORT_CONTACT_LINE_LOWER in message.lower():
         return message
     separator = "\n\n" if "\n" in message else " "
     return f"{message}{separator}{SUPPORT_CONTACT_LINE}"
@@ -37,15 +66,14 @@ def show_message_box(
     when the application or UI may not yet be initialized.
     """
     try:
-        app = adsk.core.Application.get()
-        ui: Optional[adsk.core.UserInterface] = app.userInterface if app else None
+        ui = get_ui()
         if ui:
             text = message
             if icon in (
                 adsk.core.MessageBoxIconTypes.WarningIconType,
                 adsk.core.MessageBoxIconTypes.CriticalIconType,
             ):
-                text = _append_support_contact(message)
+                text = append_support_contact(message)
             ui.messageBox(text, title, icon)
     except Exception as exc:  # noqa: BLE001 - best-effort logging only
         logging.getLogger(__name__).debug("Failed to show message box: %s", exc, exc_info=True)
@@ -8,13 +8,16 @@ for the CADAgent add-in with real-time feedback and activity logging.
 import adsk.core
 import json
 import logging
+from collections import deque
 from pathlib import Path
+import queue
 import threading
 import time
 import webbrowser
-from typing import Any, Dict, Optional, List, Tuple
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
 
 from . import config
+from .general_utils import append_support_contact
 
 # Auth message types that should never be deferred or dropped
 AUTH_MESSAGE_TYPES = frozenset(['auth_success', 'auth_error', 'user_profile'])
@@ -22,20 +25,31 @@ AUTH_MESSAGE_TYPES = frozenset(['auth_success', 'auth_error', 'user_profile'])
 # Critical messages that should be dispatched as soon as palette exists (no visibility/handshake required)
 # Messages that must reach the palette even if the custom send event isn't available yet.
 CRITICAL_MESSAGE_TYPES = frozenset(['connection_status', 'auth_success', 'auth_error', 'user_profile', 'document_switched'])
-SUPPORT_CONTACT_LINE = "If issue persists, email erik@cadagent.co"
+# Synthetic account surfaced to the palette when auth bypass (dev) is enabled
+AUTH_BYPASS_EMAIL = 'dev-bypass@cadagent.local'
 SUPPORT_CONTACT_MESSAGE_TYPES = frozenset(['error', 'auth_error', 'api_keys_error'])
 
-logger = logging.getLogger(__name__)
+# Upper bound on messages queued while the palette is hidden or awaiting handshake.
+# When full, the oldest non-critical message is dropped (critical ones are coalesced).
+PENDING_MESSAGE_LIMIT = 256
+
+# Shared compact encoder for palette payloads: no per-call encoder construction and
+# no padding whitespace in the strings that cross the HTML bridge.
+_encode_json = json.JSONEncoder(separators=(',', ':')).encode
+
+# Fixed payload for the UI-thread flush custom event (pre-encoded; it never changes)
+_FLUSH_EVENT_PAYLOAD = _encode_json({"action": "flush"})
+
+# URL schemes the palette may open in the system browser
+_EXTERNAL_URL_PREFIXES = ('http://', 'https://')
+
+# Fusion's UI thread is the interpreter's main thread; looked up once for send_message's check
+_MAIN_THREAD = threading.main_thread()
 
+# Palette HTML entry point (resolved once at import)
+PALETTE_HTML_FILE = Path(__file__).resolve().parent / 'resources' / 'html' / 'index.html'
 
-def _append_support_contact(message: str) -> str:
-    """Append support contact details to user-facing error messages."""
-    if not message:
-        return SUPPORT_CONTACT_LINE
-    if SUPPORT_CONTACT_LINE.lower() in message.lower():
-        return message
-    separator = "\n\n" if "\n" in message else " "
-    return f"{message}{separator}{SUPPORT_CONTACT_LINE}"
+logger = logging.getLogger(__name__)
 
 
 class PaletteSendEventHandler(adsk.core.CustomEventHandler):
@@ -59,16 +73,14 @@ class PaletteSendEventHandler(adsk.core.CustomEventHandler):
 
             action = payload.get('action', 'send')
 
-            logger.info(
-                f"[palette_send_event] action={action}, "
-                f"thread={threading.current_thread().name}, payload_keys={list(payload.keys())}"
-            )
+            logger.debug("[palette_send_event] action=%s, payload_keys=%s", action, list(payload))
 
             if action == 'flush':
-                with self._palette_manager._retry_lock:
-                    pending_count = len(self._palette_manager._pending_messages)
-                logger.debug(f"[palette_send_event] flush requested (pending={pending_count})")
-                logger.info("Palette send event: flush pending messages")
+                # len() of a deque is atomic; no lock needed just to report it
+                logger.debug(
+                    "[palette_send_event] flush requested (pending=%d)",
+                    len(self._palette_manager._pending_messages),
+                )
                 self._palette_manager._flush_pending_messages_if_ready()
                 with self._palette_manager._retry_lock:
                     has_pending = bool(self._palette_manager._pending_messages)
@@ -105,9 +117,11 @@ class PaletteManager:
         self._ui = app.userInterface
         self._controller = controller
         self._palette: Optional[adsk.core.Palette] = None
-        self._handlers = []
+        # Strong refs keep Fusion-owned handlers alive; keyed by role so a recreated
+        # palette replaces its stale HTML handler instead of accumulating them.
+        self._handlers: Dict[str, Any] = {}
         self._is_visible = False  # Track if palette has been shown
-        self._pending_messages: List[Tuple[str, Optional[str], Dict[str, Any]]] = []  # Queue messages until palette + handshake ready
+        self._pending_messages: Deque[Tuple[str, Optional[str], Dict[str, Any]]] = deque()  # Queue messages until palette + handshake ready
         self._handshake_received = False
         self._bootstrap_sent = False
         # Retry mechanism for failed message sends
@@ -118,6 +132,12 @@ class PaletteManager:
         self._send_event_id = 'CADAgentPaletteSend'
         self._send_event = None
         self._send_event_handler = None
+        # file:// URL of the palette HTML, cached after the first successful lookup
+        self._html_url: Optional[str] = None
+        # Single long-lived worker for blocking palette actions (auth, key saves)
+        self._background_jobs: "queue.SimpleQueue[Optional[Callable[[], None]]]" = queue.SimpleQueue()
+        self._background_worker: Optional[threading.Thread] = None
+        self._background_lock = threading.Lock()
 
     def start(self) -> None:
         """Create the palette (but don't show it yet - call show_palette() when workspace is ready)."""
@@ -184,13 +204,13 @@ class PaletteManager:
 
         logger.info("Creating (or recreating) palette instance")
 
-        # Acquire HTML path
-        html_file = Path(__file__).resolve().parent / 'resources' / 'html' / 'index.html'
-        if not html_file.exists():
-            raise FileNotFoundError(f"HTML file not found: {html_file}")
-
-        html_url = html_file.as_uri()
-        logger.info(f"HTML file exists: ✓ ({html_file})")
+        # Acquire HTML URL (palettes are recreated on workspace switches; the file doesn't move)
+        html_url = self._html_url
+        if html_url is None:
+            if not PALETTE_HTML_FILE.exists():
+                raise FileNotFoundError(f"HTML file not found: {PALETTE_HTML_FILE}")
+            html_url = self._html_url = PALETTE_HTML_FILE.as_uri()
+            logger.info(f"HTML file exists: ✓ ({PALETTE_HTML_FILE})")
         logger.info(f"Using palette HTML URL: {html_url}")
 
         # Create palette
@@ -223,7 +243,7 @@ class PaletteManager:
         # Register HTML event handler (one per palette instance)
         on_html_event = HTMLEventHandler(self._controller, self)
         self._palette.incomingFromHTML.add(on_html_event)
-        self._handlers.append(on_html_event)
+        self._handlers['html_event'] = on_html_event
         logger.info("✓ HTML event handler registered")
 
         # Register custom event to marshal palette sends onto the UI thread (register once)
@@ -237,7 +257,7 @@ class PaletteManager:
                 self._send_event = self._app.registerCustomEvent(self._send_event_id)
                 self._send_event_handler = PaletteSendEventHandler(self)
                 self._send_event.add(self._send_event_handler)
-                self._handlers.append(self._send_event_handler)
+                self._handlers['send_event'] = self._send_event_handler
                 logger.info("✓ Registered palette send custom event handler")
             except Exception as e:
                 logger.error(f"❌ Failed to register palette send event: {e}")
@@ -316,7 +336,7 @@ class PaletteManager:
             try:
                 self._app.unregisterCustomEvent(self._send_event_id)
             except Exception as e:
-                logger.debug(f"Custom event unregister skipped/failed ({self._send_event_id}): {e}")
+                logger.debug("Custom event unregister skipped/failed (%s): %s", self._send_event_id, e)
 
             self._send_event = None
             self._send_event_handler = None
@@ -324,6 +344,8 @@ class PaletteManager:
             with self._retry_lock:
                 self._pending_messages.clear()
 
+            self._stop_background_worker()
+
             self._handlers.clear()
 
         except Exception as e:
@@ -339,9 +361,10 @@ class PaletteManager:
         """
         if message_type in SUPPORT_CONTACT_MESSAGE_TYPES and isinstance(kwargs.get("message"), str):
             kwargs = dict(kwargs)
-            kwargs["message"] = _append_support_contact(kwargs["message"])
+            kwargs["message"] = append_support_contact(kwargs["message"])
 
-        logger.info(f"→ send_message called: type={message_type}, doc_id={doc_id}, kwargs={kwargs}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("→ send_message called: type=%s, doc_id=%s, keys=%s", message_type, doc_id, list(kwargs))
 
         # Recreate palette if it was destroyed (e.g., workspace change)
         self._ensure_palette()
@@ -349,18 +372,14 @@ class PaletteManager:
         # Fast-path when custom send event is unavailable: send directly even off UI thread
         if not self._send_event and self._palette is not None:
             try:
-                message = {'type': message_type, **kwargs}
-                if doc_id:
-                    message['doc_id'] = doc_id
-                message_json = json.dumps(message)
-                self._palette.sendInfoToHTML('cadagent_message', message_json)
-                logger.info(f"✓ Message sent to palette via fast-path (no send_event): {message_type}")
+                self._palette.sendInfoToHTML('cadagent_message', self._encode_message(message_type, doc_id, kwargs))
+                logger.debug("✓ Message sent to palette via fast-path (no send_event): %s", message_type)
                 return
             except Exception as e:
                 logger.error(f"❌ Fast-path send failed for {message_type}: {e}; falling back to queue")
 
         # If we're not on the main/UI thread, queue and schedule a flush on the UI thread
-        if threading.current_thread() is not threading.main_thread():
+        if threading.current_thread() is not _MAIN_THREAD:
             logger.debug("send_message called off main thread; enqueueing for UI-thread flush")
             self._enqueue_message(message_type, doc_id, kwargs)
             # Try immediate flush via custom event; fall back to timed retry
@@ -389,16 +408,13 @@ class PaletteManager:
             return
 
         try:
-            message = {'type': message_type, **kwargs}
-            if doc_id:
-                message['doc_id'] = doc_id
-            message_json = json.dumps(message)
-            logger.info(f"→ Message JSON: {message_json}")
+            message_json = self._encode_message(message_type, doc_id, kwargs)
+            logger.debug("→ Message JSON for %s: %d chars", message_type, len(message_json))
 
             # Send to HTML - this triggers window.fusionJavaScriptHandler.handle('cadagent_message', ...)
             self._palette.sendInfoToHTML('cadagent_message', message_json)
 
-            logger.info(f"✓ Message sent to palette: {message_type}")
+            logger.debug("✓ Message sent to palette: %s", message_type)
 
         except RuntimeError as e:
             # RuntimeError typically means palette isn't ready (startup race condition)
@@ -414,13 +430,23 @@ class PaletteManager:
             self._enqueue_message(message_type, doc_id, kwargs)
             self._schedule_retry_flush()
 
+    @staticmethod
+    def _encode_message(message_type: str, doc_id: Optional[str], kwargs: Dict[str, Any]) -> str:
+        """Encode a palette message envelope once, ready for sendInfoToHTML."""
+        message = {'type': message_type, **kwargs}
+        if doc_id:
+            message['doc_id'] = doc_id
+        return _encode_json(message)
+
     def _fire_flush_event(self) -> bool:
         """Fire custom event to flush pending messages on the UI thread."""
+        # A missing event is an expected startup/teardown state (callers fall back to
+        # the retry timer), so it is checked up front rather than raised and logged.
+        if not self._send_event:
+            logger.debug("Palette send event not registered; cannot flush via event")
+            return False
         try:
-            if not self._send_event:
-                logger.warning("Palette send event not registered; cannot flush via event")
-                return False
-            self._app.fireCustomEvent(self._send_event_id, json.dumps({"action": "flush"}))
+            self._app.fireCustomEvent(self._send_event_id, _FLUSH_EVENT_PAYLOAD)
             return True
         except Exception as e:
             logger.error(f"Failed to fire palette flush event: {e}", exc_info=True)
@@ -451,7 +477,7 @@ class PaletteManager:
                 if value is not None:
                     payload[key] = value
 
-        message_json = json.dumps(payload)
+        message_json = _encode_json(payload)
         logger.info(f"→ fusionReady payload: {message_json}")
 
         try:
@@ -473,7 +499,7 @@ class PaletteManager:
                 if profile:
                     self.send_message('user_profile', profile=profile)
             except Exception as e:
-                logger.debug(f"Deferred profile fetch after handshake failed: {e}")
+                logger.debug("Deferred profile fetch after handshake failed: %s", e)
         self._flush_pending_messages_if_ready()
 
     def send_bootstrap_if_ready(self) -> None:
@@ -505,8 +531,7 @@ class PaletteManager:
 
         # In bypass mode, immediately surface a synthetic auth_success + user_profile
         if self._controller.is_auth_bypass():
-            self.send_message('auth_success', message='Auth bypass enabled (dev)', user={'email': 'dev-bypass@cadagent.local'})
-            self.send_message('user_profile', profile={'email': 'dev-bypass@cadagent.local'})
+            self.send_auth_bypass_success()
 
         if active_doc_id and sid:
             try:
@@ -586,7 +611,7 @@ class PaletteManager:
             if not can_send_normal and not can_send_critical:
                 return
 
-            logger.info(f"Flushing {len(self._pending_messages)} pending palette messages")
+            logger.debug("Flushing %d pending palette messages", len(self._pending_messages))
             # Use a copy to avoid mutation issues if send_message queues again (it can now on failure)
             pending = list(self._pending_messages)
             self._pending_messages.clear()
@@ -606,14 +631,24 @@ class PaletteManager:
             # For critical messages, replace any existing message of the same type
             if message_type in CRITICAL_MESSAGE_TYPES:
                 # Remove any existing message of this type
-                self._pending_messages = [
+                self._pending_messages = deque(
                     (mt, did, kw) for (mt, did, kw) in self._pending_messages
                     if mt != message_type
-                ]
-                logger.debug(f"Critical message {message_type} coalesced (replacing older)")
+                )
+                logger.debug("Critical message %s coalesced (replacing older)", message_type)
+            elif len(self._pending_messages) >= PENDING_MESSAGE_LIMIT:
+                self._drop_oldest_non_critical()
 
             self._pending_messages.append((message_type, doc_id, kwargs))
 
+    def _drop_oldest_non_critical(self) -> None:
+        """Evict the oldest queued non-critical message (caller holds _retry_lock)."""
+        for index, (mt, _, _) in enumerate(self._pending_messages):
+            if mt not in CRITICAL_MESSAGE_TYPES:
+                del self._pending_messages[index]
+                logger.warning(f"Palette queue full ({PENDING_MESSAGE_LIMIT}); dropped oldest '{mt}' message")
+                return
+
     def _schedule_retry_flush(self) -> None:
         """Schedule a retry flush with exponential backoff."""
         with self._retry_lock:
@@ -658,6 +693,51 @@ class PaletteManager:
                 self._retry_timer = None
             self._retry_delay_sec = 0.3
 
+    def run_in_background(self, job: Callable[[], None]) -> None:
+        """Queue a blocking job for the palette's background worker thread.
+
+        Jobs run one at a time, in submission order, on a single daemon thread that is
+        started on first use, so palette actions don't pay for a new thread each time.
+        A stalled job delays everything queued after it; user-facing network calls
+        should use ``run_auth_job`` instead.
+        """
+        with self._background_lock:
+            if self._background_worker is None or not self._background_worker.is_alive():
+                self._background_worker = threading.Thread(
+                    target=self._background_loop, name="CADAgentPaletteWorker", daemon=True
+                )
+                self._background_worker.start()
+        self._background_jobs.put(job)
+
+    @staticmethod
+    def run_auth_job(job: Callable[[], None], name: str) -> None:
+        """
+        Run a sign-in network call on its own daemon thread.
+
+        Signup, OTP and verify requests (and the startup connection warm-up) can each
+        take up to the HTTP timeout, so they are kept off the shared worker queue: one
+        stalled request must not hold up the user's next action or wait behind startup jobs.
+        """
+        threading.Thread(target=job, name=name, daemon=True).start()
+
+    def _background_loop(self) -> None:
+        """Run queued jobs until the None sentinel arrives."""
+        while True:
+            job = self._background_jobs.get()
+            if job is None:
+                return
+            try:
+                job()
+            except Exception as e:
+                logger.error(f"Palette background job failed: {e}", exc_info=True)
+
+    def _stop_background_worker(self) -> None:
+        """Ask the worker to exit once queued jobs finish (does not block the UI thread)."""
+        with self._background_lock:
+            if self._background_worker is not None and self._background_worker.is_alive():
+                self._background_jobs.put(None)
+            self._background_worker = None
+
     def send_log(
         self,
         level: str,
@@ -704,6 +784,12 @@ class PaletteManager:
         """Send error message to the palette."""
         self.send_message('error', doc_id=doc_id, message=message)
 
+    def send_auth_bypass_success(self, include_profile: bool = True) -> None:
+        """Report the synthetic dev-bypass login (auth_success, optionally user_profile)."""
+        self.send_message('auth_success', message='Auth bypass enabled (dev)', user={'email': AUTH_BYPASS_EMAIL})
+        if include_profile:
+            self.send_message('user_profile', profile={'email': AUTH_BYPASS_EMAIL})
+
     def send_document_switched(self, doc_id: str, doc_name: str, session_id: str) -> None:
         """Notify HTML that the active document context switched.
 
@@ -717,7 +803,7 @@ class PaletteManager:
             logger.debug("document_switched sent without send_event (critical fast-path)")
             message = {'type': 'document_switched', 'doc_id': doc_id, 'doc_name': doc_name, 'session_id': session_id}
             try:
-                self._palette.sendInfoToHTML('cadagent_message', json.dumps(message))
+                self._palette.sendInfoToHTML('cadagent_message', _encode_json(message))
                 logger.info("✓ document_switched delivered via fast-path")
             except Exception as e:
                 logger.error(f"❌ Failed to fast-path document_switched: {e}")
@@ -738,17 +824,15 @@ class HTMLEventHandler(adsk.core.HTMLEventHandler):
 
     def notify(self, args: adsk.core.HTMLEventArgs) -> None:
         """Handle incoming messages from HTML."""
-        logger.info("=" * 60)
-        logger.info("← HTML EVENT RECEIVED")
-        logger.info("=" * 60)
-
         try:
             html_args = adsk.core.HTMLEventArgs.cast(args)
             action = getattr(html_args, 'action', None)
             data_str = getattr(html_args, 'data', None) or ''
 
-            logger.info(f"← Fusion action value: {action}")
-            logger.info(f"← Raw data: {data_str}")
+            logger.info("← HTML event received: action=%s, %d chars", action, len(data_str))
+            # Raw payloads can carry base64 images, OTP codes and API keys; dump them only in debug mode
+            if config.DEBUG:
+                logger.debug("← Raw data: %s", data_str)
 
             # Validate that this is our expected action
             if action != 'messageFromPalette':
@@ -768,8 +852,7 @@ class HTMLEventHandler(adsk.core.HTMLEventHandler):
                 payload = {}
 
             action_name = payload.get('action')
-            logger.info(f"← Parsed action: {action_name}")
-            logger.info(f"← Parsed data: {payload}")
+            logger.info("← Parsed action: %s", action_name)
 
             if action_name == 'handshake':
                 logger.info("← Handshake request received")
@@ -848,7 +931,7 @@ class HTMLEventHandler(adsk.core.HTMLEventHandler):
                 try:
                     self._controller._activate_session_for_current_document()
                 except Exception as exc:  # defensive; don't break UI on reconnect attempt
-                    logger.debug(f"Deferred session activation during get_status failed: {exc}")
+                    logger.debug("Deferred session activation during get_status failed: %s", exc)
                 self._palette_manager.send_connection_status(doc_id=self._controller.get_active_doc_id())
 
             elif action_name == 'reconnect_request':
@@ -953,12 +1036,7 @@ class HTMLEventHandler(adsk.core.HTMLEventHandler):
                 logger.info(f"← Check and handle signup request received (email={email})")
                 if self._controller.is_auth_bypass():
                     logger.info("[auth] bypass enabled; skipping Supabase signup/login flow")
-                    self._palette_manager.send_message(
-                        'auth_success',
-                        message='Auth bypass enabled (dev)',
-                        user={'email': 'dev-bypass@cadagent.local'}
-                    )
-                    self._palette_manager.send_message('user_profile', profile={'email': 'dev-bypass@cadagent.local'})
+                    self._palette_manager.send_auth_bypass_success()
                     return
                 if not email:
                     logger.warning("Email is required for signup/login")
@@ -986,19 +1064,15 @@ class HTMLEventHandler(adsk.core.HTMLEventHandler):
                             logger.error(f"Failed to check and handle signup: {e}")
                             self._palette_manager.send_message('auth_error', message=str(e))
 
-                    threading.Thread(target=_do_check_and_signup, daemon=True).start()
-                    logger.info(f"[auth] Check and signup started in background thread")
+                    self._palette_manager.run_auth_job(_do_check_and_signup, "CADAgentAuthSignup")
+                    logger.info("[auth] Check and signup started in background thread")
 
             elif action_name == 'send_otp_code':
                 email = payload.get('email', '').strip()
                 logger.info(f"← Send OTP code request received (email={email})")
                 if self._controller.is_auth_bypass():
                     logger.info("[auth] bypass enabled; ignoring OTP send request")
-                    self._palette_manager.send_message(
-                        'auth_success',
-                        message='Auth bypass enabled (dev)',
-                        user={'email': 'dev-bypass@cadagent.local'}
-                    )
+                    self._palette_manager.send_auth_bypass_success(include_profile=False)
                     return
                 if not email:
                     logger.warning("Email is required for OTP code")
@@ -1014,8 +1088,8 @@ class HTMLEventHandler(adsk.core.HTMLEventHandler):
                             logger.error(f"Failed to send OTP code: {e}")
                             self._palette_manager.send_message('auth_error', message=str(e))
                     
-                    threading.Thread(target=_do_send_otp, daemon=True).start()
-                    logger.info(f"[auth] OTP send started in background thread")
+                    self._palette_manager.run_auth_job(_do_send_otp, "CADAgentAuthSendOtp")
+                    logger.info("[auth] OTP send started in background thread")
 
             elif action_name == 'verify_otp_code':
                 email = payload.get('email', '').strip()
@@ -1023,12 +1097,7 @@ class HTMLEventHandler(adsk.core.HTMLEventHandler):
                 logger.info(f"← Verify OTP code request received (email={email})")
                 if self._controller.is_auth_bypass():
                     logger.info("[auth] bypass enabled; skipping OTP verification")
-                    self._palette_manager.send_message(
-                        'auth_success',
-                        message='Auth bypass enabled (dev)',
-                        user={'email': 'dev-bypass@cadagent.local'}
-                    )
-                    self._palette_manager.send_message('user_profile', profile={'email': 'dev-bypass@cadagent.local'})
+                    self._palette_manager.send_auth_bypass_success()
                     return
                 if not email or not code:
                     logger.warning("Email and code are required for OTP verification")
@@ -1055,10 +1124,8 @@ class HTMLEventHandler(adsk.core.HTMLEventHandler):
                             logger.error(f"Failed to verify OTP code: {e}")
                             self._palette_manager.send_message('auth_error', message=str(e))
                     
-                    # Start verification in background thread
-                    verify_thread = threading.Thread(target=_do_verify, daemon=True)
-                    verify_thread.start()
-                    logger.info(f"[auth] OTP verification started in background thread")
+                    self._palette_manager.run_auth_job(_do_verify, "CADAgentAuthVerify")
+                    logger.info("[auth] OTP verification started in background thread")
 
             elif action_name == 'login_with_password':
                 logger.info("← Password login request received (disabled)")
@@ -1073,12 +1140,7 @@ class HTMLEventHandler(adsk.core.HTMLEventHandler):
                 logger.info("← Auth callback received")
                 if self._controller.is_auth_bypass():
                     logger.info("[auth] bypass enabled; ignoring auth callback")
-                    self._palette_manager.send_message(
-                        'auth_success',
-                        message='Auth bypass enabled (dev)',
-                        user={'email': 'dev-bypass@cadagent.local'}
-                    )
-                    self._palette_manager.send_message('user_profile', profile={'email': 'dev-bypass@cadagent.local'})
+                    self._palette_manager.send_auth_bypass_success()
                     return
                 if not access_token or not refresh_token:
                     logger.warning("Missing tokens in auth callback")
@@ -1154,8 +1216,8 @@ class HTMLEventHandler(adsk.core.HTMLEventHandler):
                             logger.error(f"Failed to save API keys: {e}")
                             self._palette_manager.send_message('api_keys_error', message=str(e))
 
-                    threading.Thread(target=_do_save_keys, daemon=True).start()
-                    logger.info("[api_keys] Save keys started in background thread")
+                    self._palette_manager.run_in_background(_do_save_keys)
+                    logger.info("[api_keys] Save keys queued for background worker")
 
             elif action_name == 'open_external_url':
                 url = payload.get('url', '').strip()
@@ -1163,7 +1225,7 @@ class HTMLEventHandler(adsk.core.HTMLEventHandler):
 
                 if not url:
                     logger.warning("open_external_url: URL is empty")
-                elif not (url.startswith('http://') or url.startswith('https://')):
+                elif not url.startswith(_EXTERNAL_URL_PREFIXES):
                     logger.warning(f"open_external_url: Invalid URL protocol: {url}")
                 else:
                     try:
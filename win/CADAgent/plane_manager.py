@@ -52,6 +52,16 @@ class PlaneManager:
         self.axes: Dict[str, adsk.fusion.ConstructionAxis] = {}
         logger.info("PlaneManager initialized with datum planes: XY, XZ, YZ")
 
+    def _get_design(self) -> Optional[adsk.fusion.Design]:
+        """
+        Design that owns this manager's root component.
+
+        Resolved from the component (one API call) rather than via
+        Application.get().activeProduct, which also keeps token lookups bound to
+        this manager's document when another document is active.
+        """
+        return self.root_component.parentDesign
+
     def get_plane(self, plane_id: str) -> adsk.fusion.ConstructionPlane:
         """
         Retrieve a plane by ID, or auto-create from a face entity token.
@@ -98,8 +108,7 @@ class PlaneManager:
         # Fusion entity tokens for faces often contain these patterns
         # Also check if it can be resolved via findEntityByToken
         try:
-            app = adsk.core.Application.get()
-            design = adsk.fusion.Design.cast(app.activeProduct)
+            design = self._get_design()
             if not design:
                 return False
             entities = design.findEntityByToken(value)
@@ -230,7 +239,7 @@ class PlaneManager:
         plane_input.setByOffset(base_plane, offset_value)
 
         created_plane = planes.add(plane_input)
-        logger.debug(f"Created offset plane: {offset_cm} cm from {base_datum}")
+        logger.debug("Created offset plane: %s cm from %s", offset_cm, base_datum)
         return created_plane
 
     def _resolve_builtin_reference(
@@ -327,7 +336,7 @@ class PlaneManager:
         axis_input.setByTwoPoints(origin, second_point)
 
         created_axis = construction_axes.add(axis_input)
-        logger.debug(f"Created local axis '{axis_name}' from plane '{plane_id}'")
+        logger.debug("Created local axis '%s' from plane '%s'", axis_name, plane_id)
 
         return created_axis
 
@@ -434,7 +443,7 @@ class PlaneManager:
         plane_input.setByAngle(edge, angle_value, face)
 
         created_plane = planes.add(plane_input)
-        logger.debug(f"Created angled plane: {angle_deg}° around edge relative to face")
+        logger.debug("Created angled plane: %s° around edge relative to face", angle_deg)
         return created_plane
 
     def _create_face_plane(self, params: Dict[str, Any]) -> adsk.fusion.ConstructionPlane:
@@ -470,7 +479,7 @@ class PlaneManager:
         plane_input.setByOffset(face, zero_offset)
 
         created_plane = planes.add(plane_input)
-        logger.debug(f"Created plane coincident with face '{face_token}'")
+        logger.debug("Created plane coincident with face '%s'", face_token)
         return created_plane
 
     def _resolve_entity_token(
@@ -493,8 +502,7 @@ class PlaneManager:
         """
         try:
             # Use Fusion's find method to resolve the token
-            app = adsk.core.Application.get()
-            design = adsk.fusion.Design.cast(app.activeProduct)
+            design = self._get_design()
             if not design:
                 raise PlaneCreationError("No active design")
 
@@ -134,7 +134,7 @@ def _extract_entity_info(entity: Any) -> Optional[Dict[str, Any]]:
 
         else:
             # Other entity types (vertices, sketches, etc.) - basic info only
-            logger.debug(f"Unsupported entity type for detailed extraction: {object_type}")
+            logger.debug("Unsupported entity type for detailed extraction: %s", object_type)
             return {
                 "type": "other",
                 "object_type": object_type
@@ -198,7 +198,7 @@ def _extract_face_info(face: adsk.fusion.BRepFace) -> Dict[str, Any]:
             }
 
     except Exception as e:
-        logger.debug(f"Error extracting face details: {e}")
+        logger.debug("Error extracting face details: %s", e)
 
     return info
 
@@ -254,7 +254,7 @@ def _extract_edge_info(edge: adsk.fusion.BRepEdge) -> Dict[str, Any]:
             }
 
     except Exception as e:
-        logger.debug(f"Error extracting edge details: {e}")
+        logger.debug("Error extracting edge details: %s", e)
 
     return info
 
@@ -300,7 +300,7 @@ def _extract_body_info(body: adsk.fusion.BRepBody) -> Dict[str, Any]:
             info["edge_count"] = body.edges.count
 
     except Exception as e:
-        logger.debug(f"Error extracting body details: {e}")
+        logger.debug("Error extracting body details: %s", e)
 
     return info
 
@@ -11,31 +11,53 @@ Fusion 360's embedded Python 3.14 environment.
 import json
 import logging
 import os
+import re
 import sys
+import threading
 import time
+import random
 import secrets
 from datetime import datetime, date
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
-# Ensure bundled dependencies are available
-_LIB_PATH = Path(__file__).parent / "lib"
-if str(_LIB_PATH) not in sys.path:
-    sys.path.insert(0, str(_LIB_PATH))
-
-import httpx
+# Fall back to the bundled lib directory only when httpx isn't already importable
+try:
+    import httpx
+except ImportError:
+    _LIB_PATH = str(Path(__file__).parent / "lib")
+    if _LIB_PATH not in sys.path:
+        sys.path.insert(0, _LIB_PATH)
+    import httpx
 
 logger = logging.getLogger(__name__)
 
+# Auth traffic is a handful of sequential calls to one host; a small pool keeps
+# one warm keep-alive connection without holding sockets open for parallel use.
+_HTTP_LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=2)
+
+# How long a fetched /me profile is reused for the same access token
+_PROFILE_CACHE_TTL_SECONDS = 300.0
+# Error responses larger than this are not JSON-parsed; raw error text is trimmed for messages
+_MAX_ERROR_BODY_BYTES = 64 * 1024
+_ERROR_TEXT_PREVIEW_CHARS = 500
+
+
+# Fusion Application pinned after the first probe; adsk is only importable inside Fusion,
+# so it is resolved lazily instead of at module import.
+_probe_app: Optional[Any] = None
+
 
 def _fusion_probe_auth(message: str) -> None:
     """Best-effort log to Fusion Text Commands for auth debugging."""
+    global _probe_app
     try:
-        import adsk.core  # type: ignore
+        if _probe_app is None:
+            import adsk.core  # type: ignore
 
-        app = adsk.core.Application.get()
-        if app:
-            app.log(message)
+            _probe_app = adsk.core.Application.get()
+        if _probe_app:
+            _probe_app.log(message)
     except Exception:
         pass
 
@@ -47,14 +69,55 @@ def _fmt_minutes_until(ts: Optional[float]) -> str:
     return f"{delta/60:.1f}m" if delta >= 0 else f"{delta/60:.1f}m ago"
 
 
+# Supabase error fragments meaning "this email already has an account",
+# compiled once so classification is a single scan instead of N substring checks.
+# Matching is case-insensitive, so callers never build a lowered copy of the message.
+_EXISTING_USER_ERROR_RE = re.compile(
+    "already registered"
+    "|already exists"
+    "|user already"
+    "|duplicate key value"
+    "|user exists",
+    re.IGNORECASE,
+)
+
+# Supabase refresh-token errors that no retry can recover from
+_INVALID_REFRESH_TOKEN_ERROR_RE = re.compile(
+    "invalid refresh token|already used|expired refresh token", re.IGNORECASE
+)
+
+# Attempts for a token refresh before giving up (backoff ~1s, ~2s between them). Only
+# connection failures are retried: the request never reached Supabase, so the
+# single-use refresh token is still unspent.
+_REFRESH_ATTEMPTS = 3
+# Per-attempt timeout for a refresh, well under the client's 30s default
+_REFRESH_TIMEOUT_SECONDS = 5.0
+# A token this close to expiry is refreshed inline; earlier, it is refreshed in the
+# background while the current token keeps serving requests
+_INLINE_REFRESH_MARGIN_SECONDS = 15.0
+# Pause after a failed background refresh before the next one is started
+_BACKGROUND_REFRESH_RETRY_SECONDS = 30.0
+# Backoff is base * 2**attempt, capped, plus up to _REFRESH_JITTER_SECONDS of random jitter
+_REFRESH_BACKOFF_BASE_SECONDS = 1.0
+_REFRESH_BACKOFF_CAP_SECONDS = 8.0
+_REFRESH_JITTER_SECONDS = 0.25
+# Statuses worth retrying, only from a background refresh: request timeout and rate
+# limiting, both rejected before the refresh token is consumed
+_RETRYABLE_STATUS_CODES = frozenset({408, 429})
+
+# Supabase error fragments meaning the project has signups turned off
+_SIGNUPS_DISABLED_ERROR_RE = re.compile("signups not allowed|signup disabled", re.IGNORECASE)
+
+
 def _is_invalid_refresh_token(err: Exception) -> bool:
     """Detect irrecoverable refresh-token errors."""
-    msg = str(err).lower()
-    return "invalid refresh token" in msg or "already used" in msg or "expired refresh token" in msg
+    return _INVALID_REFRESH_TOKEN_ERROR_RE.search(str(err)) is not None
 
 
 class SimpleSession:
     """Simple session object to hold auth tokens."""
+    __slots__ = ("access_token", "refresh_token", "expires_at", "user")
+
     def __init__(self, access_token: str, refresh_token: str, expires_at: Optional[float] = None, user: Optional[Dict] = None):
         self.access_token = access_token
         self.refresh_token = refresh_token
@@ -81,7 +144,39 @@ class SupabaseAuthClient:
         """
         self.supabase_url = supabase_url.rstrip('/')
         self.supabase_key = supabase_key
+        # Endpoint URLs are fixed per client, so they are joined once here
+        self._otp_url = f"{self.supabase_url}/auth/v1/otp"
+        self._signup_url = f"{self.supabase_url}/auth/v1/signup"
+        self._password_token_url = f"{self.supabase_url}/auth/v1/token?grant_type=password"
+        self._verify_url = f"{self.supabase_url}/auth/v1/verify"
+        self._user_url = f"{self.supabase_url}/auth/v1/user"
+        self._refresh_token_url = f"{self.supabase_url}/auth/v1/token?grant_type=refresh_token"
+        self._profile_url = f"{self.supabase_url}/functions/v1/me"
+        self._health_url = f"{self.supabase_url}/auth/v1/health"
+        # Every auth call sends the same anon-key headers; httpx copies them per request
+        self._auth_headers: Dict[str, str] = {
+            "apikey": supabase_key,
+            "Content-Type": "application/json",
+        }
+        self._authenticated_headers: Optional[Tuple[str, Dict[str, str]]] = None
         self._session: Optional[SimpleSession] = None
+        # (access_token, monotonic fetch time, user) from the last successful /me call
+        self._profile_cache: Optional[Tuple[str, float, Dict[str, Any]]] = None
+        # One pooled client for every auth call so repeated requests to the
+        # Supabase host reuse the same keep-alive TCP+TLS connection.
+        self._http: Optional[httpx.Client] = None
+        self._http_lock = threading.Lock()
+        # Set by close(); late background jobs must not re-create the client after shutdown
+        self._closed = False
+        # Serializes refreshes: a refresh token is single-use, so two concurrent
+        # refreshes with the same token would invalidate the session
+        self._refresh_lock = threading.Lock()
+        # Guards installing a refreshed session against clear_session(); held only for
+        # the swap and the disk write so a logout never waits on a refresh's network call
+        self._session_lock = threading.Lock()
+        self._background_refresh_lock = threading.Lock()
+        self._background_refresh_running = False
+        self._background_refresh_not_before = 0.0
 
         # Session storage path (in user's home directory)
         self.session_file = Path.home() / ".cadagent" / "session.json"
@@ -89,20 +184,74 @@ class SupabaseAuthClient:
 
         logger.info("SupabaseAuthClient initialized (HTTP-based)")
 
+    def _client(self) -> httpx.Client:
+        """Return the shared HTTP client, creating it on first use."""
+        with self._http_lock:
+            if self._closed:
+                raise RuntimeError("SupabaseAuthClient is closed")
+            if self._http is None or self._http.is_closed:
+                self._http = httpx.Client(timeout=30.0, limits=_HTTP_LIMITS)
+            return self._http
+
+    def warm_up(self) -> None:
+        """
+        Open the pooled connection to Supabase ahead of the first auth call.
+
+        Blocking; run it off the UI thread. The TCP+TLS handshake is paid here so a
+        later sign-in request reuses the kept-alive connection. Failures are ignored.
+        """
+        if self._closed:
+            return
+        try:
+            self._client().get(self._health_url, headers=self._auth_headers, timeout=5.0)
+        except RuntimeError:
+            # close() ran first; the add-in is stopping
+            return
+        except httpx.HTTPError as e:
+            logger.debug("[auth] Connection warm-up failed: %s", e)
+
+    def close(self) -> None:
+        """Close the pooled HTTP client (called when the add-in stops); it is not reopened."""
+        with self._http_lock:
+            self._closed = True
+            if self._http is not None:
+                try:
+                    self._http.close()
+                except Exception as e:
+                    logger.debug("[auth] HTTP client close failed: %s", e)
+                self._http = None
+
     def _get_auth_headers(self) -> Dict[str, str]:
         """Get headers for Supabase Auth API calls."""
-        return {
-            "apikey": self.supabase_key,
-            "Content-Type": "application/json",
-        }
+        return self._auth_headers
 
     def _get_authenticated_headers(self, access_token: str) -> Dict[str, str]:
         """Get headers for authenticated API calls."""
-        return {
-            "apikey": self.supabase_key,
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        # Rebuilt only when the token changes; otherwise the last dict is reused as is
+        cached = self._authenticated_headers
+        if cached is None or cached[0] != access_token:
+            cached = (access_token, {**self._auth_headers, "Authorization": f"Bearer {access_token}"})
+            self._authenticated_headers = cached
+        return cached[1]
+
+    @staticmethod
+    def _error_message(response: httpx.Response, default: Optional[str] = None) -> str:
+        """Extract Supabase's error text from a failed response, falling back to the raw body."""
+        error_data: Any = {}
+        # Supabase error bodies are small JSON objects; anything past the cap is a proxy
+        # error page (e.g. an HTML 502), so it isn't parsed and only a preview is kept
+        content = response.content
+        if content and len(content) <= _MAX_ERROR_BODY_BYTES:
+            try:
+                error_data = response.json()
+            except ValueError:
+                error_data = {}
+        if not isinstance(error_data, dict):
+            error_data = {}
+        error_msg = error_data.get("error_description", error_data.get("msg"))
+        if error_msg is None:
+            return default if default is not None else response.text[:_ERROR_TEXT_PREVIEW_CHARS]
+        return error_msg
 
     @staticmethod
     def _normalize_email(email: str) -> str:
@@ -117,15 +266,7 @@ class SupabaseAuthClient:
     @staticmethod
     def _is_existing_user_error(error_msg: str) -> bool:
         """Heuristics for Supabase errors that mean the user already exists."""
-        msg = (error_msg or "").lower()
-        return any(keyword in msg for keyword in [
-            "already registered",
-            "already exists",
-            "user already",
-            "duplicate key value",
-            "user exists",
-            "email address is already registered",
-        ])
+        return _EXISTING_USER_ERROR_RE.search(error_msg or "") is not None
 
     def _parse_session_response(self, data: Dict) -> Optional[SimpleSession]:
         """Parse session from Supabase auth response."""
@@ -156,7 +297,7 @@ class SupabaseAuthClient:
             )
             logger.info(f"[auth] Using redirect URL: {redirect_url}")
 
-            url = f"{self.supabase_url}/auth/v1/otp"
+            url = self._otp_url
             payload = {
                 "email": email,
                 "create_user": True,
@@ -167,14 +308,13 @@ class SupabaseAuthClient:
             if redirect_url:
                 payload["options"] = {"email_redirect_to": redirect_url}
 
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(url, json=payload, headers=self._get_auth_headers())
+            response = self._client().post(url, json=payload, headers=self._get_auth_headers())
 
             if response.status_code in (200, 201):
                 logger.info(f"[auth] Magic link request sent")
                 return {"success": True, "message": "Magic link sent! Check your email."}
             else:
-                error_msg = response.json().get("error_description", response.json().get("msg", response.text))
+                error_msg = self._error_message(response)
                 raise Exception(f"Failed to send magic link: {error_msg}")
 
         except Exception as e:
@@ -190,21 +330,19 @@ class SupabaseAuthClient:
 
             logger.info(f"[auth] Sending OTP code to {email} (allow_signup={allow_signup})")
 
-            url = f"{self.supabase_url}/auth/v1/otp"
+            url = self._otp_url
             payload = {
                 "email": email,
                 "create_user": bool(allow_signup),
             }
 
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(url, json=payload, headers=self._get_auth_headers())
+            response = self._client().post(url, json=payload, headers=self._get_auth_headers())
 
             if response.status_code in (200, 201):
                 logger.info(f"[auth] OTP code request sent")
                 return {"success": True, "message": "Code sent! Check your email."}
             else:
-                error_data = response.json() if response.text else {}
-                error_msg = error_data.get("error_description", error_data.get("msg", response.text))
+                error_msg = self._error_message(response)
                 raise Exception(f"Failed to send OTP code: {error_msg}")
 
         except Exception as e:
@@ -221,14 +359,13 @@ class SupabaseAuthClient:
             logger.info(f"[auth] Creating instant signup for {email}")
             random_password = self._generate_random_password()
 
-            url = f"{self.supabase_url}/auth/v1/signup"
+            url = self._signup_url
             payload = {
                 "email": email,
                 "password": random_password,
             }
 
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(url, json=payload, headers=self._get_auth_headers())
+            response = self._client().post(url, json=payload, headers=self._get_auth_headers())
 
             if response.status_code in (200, 201):
                 data = response.json()
@@ -246,8 +383,7 @@ class SupabaseAuthClient:
                 else:
                     raise Exception("Signup returned no session")
             else:
-                error_data = response.json() if response.text else {}
-                error_msg = error_data.get("error_description", error_data.get("msg", response.text))
+                error_msg = self._error_message(response)
                 raise Exception(error_msg)
 
         except Exception as e:
@@ -274,11 +410,11 @@ class SupabaseAuthClient:
                 self.clear_session(delete_disk=True)
                 logger.info(f"[auth] New account created for {email}; requiring OTP for login")
             except Exception as signup_error:
-                error_msg = str(signup_error).lower()
+                error_msg = str(signup_error)
 
                 if self._is_existing_user_error(error_msg):
                     logger.info(f"[auth] User {email} already exists - sending OTP")
-                elif "signups not allowed" in error_msg or "signup disabled" in error_msg:
+                elif _SIGNUPS_DISABLED_ERROR_RE.search(error_msg):
                     raise Exception("Signups are disabled in Supabase")
                 else:
                     raise
@@ -302,14 +438,13 @@ class SupabaseAuthClient:
         try:
             logger.info(f"[auth] Password login attempt for {email}")
             
-            url = f"{self.supabase_url}/auth/v1/token?grant_type=password"
+            url = self._password_token_url
             payload = {
                 "email": email,
                 "password": password,
             }
 
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(url, json=payload, headers=self._get_auth_headers())
+            response = self._client().post(url, json=payload, headers=self._get_auth_headers())
 
             if response.status_code == 200:
                 data = response.json()
@@ -326,8 +461,7 @@ class SupabaseAuthClient:
                 else:
                     raise Exception("Login returned no session")
             else:
-                error_data = response.json() if response.text else {}
-                error_msg = error_data.get("error_description", error_data.get("msg", "Login failed"))
+                error_msg = self._error_message(response, "Login failed")
                 raise Exception(error_msg)
 
         except Exception as e:
@@ -345,15 +479,14 @@ class SupabaseAuthClient:
 
             logger.info(f"[auth] Verifying OTP code for {email}")
 
-            url = f"{self.supabase_url}/auth/v1/verify"
+            url = self._verify_url
             payload = {
                 "email": email,
                 "token": code,
                 "type": "email",
             }
 
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(url, json=payload, headers=self._get_auth_headers())
+            response = self._client().post(url, json=payload, headers=self._get_auth_headers())
 
             if response.status_code == 200:
                 data = response.json()
@@ -370,8 +503,7 @@ class SupabaseAuthClient:
                 else:
                     raise Exception("OTP verification returned no session")
             else:
-                error_data = response.json() if response.text else {}
-                error_msg = error_data.get("error_description", error_data.get("msg", "Verification failed"))
+                error_msg = self._error_message(response, "Verification failed")
                 raise Exception(error_msg)
 
         except Exception as e:
@@ -385,10 +517,9 @@ class SupabaseAuthClient:
             logger.info("[auth] Setting session from callback tokens")
 
             # Validate by getting user info
-            url = f"{self.supabase_url}/auth/v1/user"
+            url = self._user_url
             
-            with httpx.Client(timeout=30.0) as client:
-                response = client.get(url, headers=self._get_authenticated_headers(access_token))
+            response = self._client().get(url, headers=self._get_authenticated_headers(access_token))
 
             if response.status_code == 200:
                 user = response.json()
@@ -418,21 +549,46 @@ class SupabaseAuthClient:
             }
         return None
 
-    def _refresh_session(self, refresh_token: str) -> Optional[SimpleSession]:
-        """Refresh the session using a refresh token."""
+    def _refresh_session(self, refresh_token: str, *, background: bool = False) -> Optional[SimpleSession]:
+        """Refresh the session using a refresh token.
+
+        Connection failures are retried with jittered exponential backoff, since a
+        failed refresh clears the session and forces a fresh OTP login. Anything that
+        may have reached Supabase (read timeouts, 5xx) is not retried, so a refresh
+        token the server already consumed is never replayed. 408/429 responses are
+        retried, honoring Retry-After, only when ``background`` is set; inline callers
+        may be on the UI thread, so they fail fast instead of sleeping.
+        """
         try:
-            url = f"{self.supabase_url}/auth/v1/token?grant_type=refresh_token"
+            url = self._refresh_token_url
             payload = {"refresh_token": refresh_token}
 
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(url, json=payload, headers=self._get_auth_headers())
+            for attempt in range(_REFRESH_ATTEMPTS):
+                last_attempt = attempt == _REFRESH_ATTEMPTS - 1
+                try:
+                    response = self._client().post(
+                        url,
+                        json=payload,
+                        headers=self._get_auth_headers(),
+                        timeout=_REFRESH_TIMEOUT_SECONDS,
+                    )
+                except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                    if last_attempt:
+                        raise
+                    logger.warning(f"[auth] Token refresh attempt {attempt + 1} failed ({e}); retrying")
+                    time.sleep(self._retry_delay(attempt))
+                else:
+                    retryable = background and response.status_code in _RETRYABLE_STATUS_CODES
+                    if not retryable or last_attempt:
+                        break
+                    logger.warning(f"[auth] Token refresh attempt {attempt + 1} got HTTP {response.status_code}; retrying")
+                    time.sleep(self._retry_delay(attempt, response))
 
             if response.status_code == 200:
                 data = response.json()
                 return self._parse_session_response(data)
             else:
-                error_data = response.json() if response.text else {}
-                error_msg = error_data.get("error_description", error_data.get("msg", "Refresh failed"))
+                error_msg = self._error_message(response, "Refresh failed")
                 logger.error(f"[auth] Token refresh failed: {error_msg}")
                 return None
 
@@ -440,57 +596,153 @@ class SupabaseAuthClient:
             logger.error(f"[auth] Token refresh error: {e}")
             return None
 
+    @staticmethod
+    def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Seconds to wait before retry attempt+1, honoring a numeric Retry-After header."""
+        delay = min(_REFRESH_BACKOFF_CAP_SECONDS, _REFRESH_BACKOFF_BASE_SECONDS * 2 ** attempt)
+        if response is not None:
+            try:
+                retry_after = float(response.headers.get("Retry-After", ""))
+            except ValueError:
+                retry_after = None
+            if retry_after is not None and retry_after >= 0:
+                delay = min(_REFRESH_BACKOFF_CAP_SECONDS, retry_after)
+        return delay + random.uniform(0, _REFRESH_JITTER_SECONDS)
+
     def get_valid_access_token(self, min_buffer_seconds: int = 120) -> Optional[str]:
         """Return a non-expired access token, proactively refreshing if needed."""
-        _fusion_probe_auth("[AUTH_TOKEN] get_valid_access_token start")
+        # Probe lines are buffered and written as one Text Commands entry per checkpoint;
+        # this runs before every backend request, so per-line app.log calls add up.
+        probe_lines = ["[AUTH_TOKEN] get_valid_access_token start"]
+        try:
+            if not self._session:
+                if self.session_file.exists():
+                    logger.info("[auth] No active session; attempting restore from disk")
+                    if not self.restore_session():
+                        probe_lines.append("[AUTH_TOKEN] no session; restore failed")
+                        return None
+                else:
+                    probe_lines.append("[AUTH_TOKEN] no session file; user not signed in")
+                    return None
 
-        if not self._session:
-            if self.session_file.exists():
-                logger.info("[auth] No active session; attempting restore from disk")
-                if not self.restore_session():
-                    _fusion_probe_auth("[AUTH_TOKEN] no session; restore failed")
+            session = self._session
+            exp_ts = session.expires_at
+            probe_lines.append(f"[AUTH_TOKEN] session exp={exp_ts} ({_fmt_minutes_until(exp_ts)})")
+
+            now = time.time()
+            needs_refresh = exp_ts is not None and exp_ts <= now + min_buffer_seconds
+
+            if needs_refresh and exp_ts > now + _INLINE_REFRESH_MARGIN_SECONDS:
+                # Still usable: refresh off the calling (often UI) thread and keep serving it
+                if self._start_background_refresh(session):
+                    probe_lines.append("[AUTH_TOKEN] background refresh started")
+                return session.access_token
+
+            if needs_refresh:
+                logger.info("[auth] Access token expires soon; refreshing")
+                probe_lines.append("[AUTH_TOKEN] refresh start")
+                # Flush before the network round-trip so a hung refresh still shows up
+                _fusion_probe_auth("\n".join(probe_lines))
+                probe_lines = []
+
+                try:
+                    new_session = self._refresh_exclusive(session)
+                except TimeoutError:
+                    logger.warning("[auth] Token refresh already in progress; try again shortly")
+                    probe_lines.append("[AUTH_TOKEN] refresh busy")
+                    return None
+                if new_session:
+                    probe_lines.append(f"[AUTH_TOKEN] refresh ok exp={new_session.expires_at}")
+                    return new_session.access_token
+                else:
+                    logger.error("[auth] Token refresh failed")
+                    self.clear_session(delete_disk=False)
+                    probe_lines.append("[AUTH_TOKEN] refresh failed; session cleared")
                     return None
             else:
-                _fusion_probe_auth("[AUTH_TOKEN] no session file; user not signed in")
-                return None
+                probe_lines.append("[AUTH_TOKEN] token valid; no refresh needed")
 
-        session = self._session
-        exp_ts = session.expires_at
-        _fusion_probe_auth(f"[AUTH_TOKEN] session exp={exp_ts} ({_fmt_minutes_until(exp_ts)})")
+            return session.access_token
+        finally:
+            if probe_lines:
+                _fusion_probe_auth("\n".join(probe_lines))
 
-        now = time.time()
-        needs_refresh = exp_ts is not None and exp_ts <= now + min_buffer_seconds
+    def _refresh_exclusive(self, session: SimpleSession) -> Optional[SimpleSession]:
+        """
+        Refresh ``session`` on the calling thread, serialized with background refreshes.
 
-        if needs_refresh:
-            logger.info("[auth] Access token expires soon; refreshing")
-            _fusion_probe_auth("[AUTH_TOKEN] refresh start")
-            
+        Returns the new session (or the one another thread installed meanwhile), or None
+        if the refresh failed. Raises TimeoutError if a background refresh holds the
+        lock for longer than one attempt, so UI-thread callers never wait out its retries.
+        """
+        if not self._refresh_lock.acquire(timeout=_REFRESH_TIMEOUT_SECONDS):
+            raise TimeoutError("token refresh already in progress")
+        try:
+            if self._session is not session:
+                return self._session
             new_session = self._refresh_session(session.refresh_token)
-            if new_session:
-                self._session = new_session
-                self.save_session(new_session)
-                _fusion_probe_auth(f"[AUTH_TOKEN] refresh ok exp={new_session.expires_at}")
-                return new_session.access_token
-            else:
-                logger.error("[auth] Token refresh failed")
-                self.clear_session(delete_disk=False)
-                _fusion_probe_auth("[AUTH_TOKEN] refresh failed; session cleared")
+            if new_session and not self._install_refreshed_session(session, new_session):
                 return None
-        else:
-            _fusion_probe_auth("[AUTH_TOKEN] token valid; no refresh needed")
+            return new_session
+        finally:
+            self._refresh_lock.release()
 
-        return session.access_token
+    def _install_refreshed_session(self, session: SimpleSession, new_session: SimpleSession) -> bool:
+        """
+        Replace ``session`` with ``new_session`` and persist it, unless it was cleared meanwhile.
+
+        The refresh call runs unlocked against clear_session(), so a logout during the
+        request must win: the refreshed tokens are dropped instead of being written back.
+        """
+        with self._session_lock:
+            if self._session is not session:
+                logger.info("[auth] Session changed during token refresh; discarding refreshed tokens")
+                return False
+            self._session = new_session
+            self.save_session(new_session)
+            return True
+
+    def _start_background_refresh(self, session: SimpleSession) -> bool:
+        """Refresh ``session`` on a daemon thread unless one is running or recently failed."""
+        with self._background_refresh_lock:
+            if self._background_refresh_running or time.monotonic() < self._background_refresh_not_before:
+                return False
+            self._background_refresh_running = True
+        threading.Thread(
+            target=self._background_refresh,
+            args=(session,),
+            name="CADAgentAuthRefresh",
+            daemon=True,
+        ).start()
+        return True
+
+    def _background_refresh(self, session: SimpleSession) -> None:
+        """Body of the background refresh; a failure leaves the still-valid session in place."""
+        try:
+            with self._refresh_lock:
+                if self._session is not session:
+                    return
+                new_session = self._refresh_session(session.refresh_token, background=True)
+                if new_session:
+                    if self._install_refreshed_session(session, new_session):
+                        logger.info("[auth] Access token refreshed in the background")
+                else:
+                    logger.warning("[auth] Background token refresh failed; will retry before expiry")
+                    self._background_refresh_not_before = time.monotonic() + _BACKGROUND_REFRESH_RETRY_SECONDS
+        finally:
+            with self._background_refresh_lock:
+                self._background_refresh_running = False
 
     def restore_session(self) -> bool:
         """Restore session from disk if it exists."""
         try:
-            if not self.session_file.exists():
+            try:
+                with open(self.session_file, 'r') as f:
+                    session_data = json.load(f)
+            except FileNotFoundError:
                 logger.info("No saved session found")
                 return False
-
             logger.info("Restoring session from disk")
-            with open(self.session_file, 'r') as f:
-                session_data = json.load(f)
 
             refresh_token = session_data.get("refresh_token")
             if not refresh_token:
@@ -551,11 +803,17 @@ class SupabaseAuthClient:
         """Clear the current session."""
         try:
             logger.info(f"Clearing session (delete_disk={delete_disk})")
-            self._session = None
-
-            if delete_disk and self.session_file.exists():
-                self.session_file.unlink()
-                logger.info("Session file deleted")
+            with self._session_lock:
+                self._session = None
+                self._profile_cache = None
+
+                if delete_disk:
+                    # A single unlink instead of exists()+unlink(); a missing file is already "cleared"
+                    try:
+                        self.session_file.unlink()
+                        logger.info("Session file deleted")
+                    except FileNotFoundError:
+                        pass
 
             logger.info("Session cleared")
 
@@ -565,8 +823,6 @@ class SupabaseAuthClient:
     def get_profile(self) -> Optional[Dict[str, Any]]:
         """Fetch the user's profile from the /me endpoint."""
         try:
-            _fusion_probe_auth("[AUTH_PROFILE] get_profile start")
-            
             if not self._session:
                 if self.session_file.exists():
                     if not self.restore_session():
@@ -576,30 +832,46 @@ class SupabaseAuthClient:
 
             access_token = self._session.access_token
 
-            url = f"{self.supabase_url}/functions/v1/me"
+            # Startup validation, the palette handshake and get_profile actions all ask for
+            # the profile within seconds of each other; reuse it while the token is unchanged.
+            cached = self._profile_cache
+            if (
+                cached is not None
+                and cached[0] == access_token
+                and time.monotonic() - cached[1] < _PROFILE_CACHE_TTL_SECONDS
+            ):
+                return cached[2]
+
+            # Probe only real fetches; cache hits would otherwise cost a Text Commands write each
+            _fusion_probe_auth("[AUTH_PROFILE] get_profile fetch")
+            url = self._profile_url
             headers = {
                 "Authorization": f"Bearer {access_token}",
                 "Content-Type": "application/json"
             }
 
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(url, headers=headers)
+            client = self._client()
+            response = client.get(url, headers=headers, timeout=10.0)
 
             if response.status_code == 200:
                 data = response.json()
                 logger.info("[auth] Profile fetched successfully")
-                return data.get("user")
+                user = data.get("user")
+                if user:
+                    self._profile_cache = (access_token, time.monotonic(), user)
+                return user
             elif response.status_code == 401:
                 # Try refreshing token
                 logger.warning("[auth] Profile fetch 401 - attempting refresh")
-                new_session = self._refresh_session(self._session.refresh_token)
+                new_session = self._refresh_exclusive(self._session)
                 if new_session:
-                    self._session = new_session
-                    self.save_session(new_session)
                     headers["Authorization"] = f"Bearer {new_session.access_token}"
-                    retry_response = client.get(url, headers=headers)
+                    retry_response = client.get(url, headers=headers, timeout=10.0)
                     if retry_response.status_code == 200:
-                        return retry_response.json().get("user")
+                        user = retry_response.json().get("user")
+                        if user:
+                            self._profile_cache = (new_session.access_token, time.monotonic(), user)
+                        return user
                 return None
             else:
                 logger.warning(f"[auth] Profile fetch failed: {response.status_code}")
@@ -614,10 +886,9 @@ class SupabaseAuthClient:
         if self._session:
             return True
         
+        # restore_session() only returns True once _session is set, so no re-check is needed
         if self.session_file.exists():
-            if self.restore_session():
-                return self._session is not None
-        
+            return self.restore_session()
         return False
 
     def _serialize_user(self, user: Any) -> Optional[Dict[str, Any]]: